@@ -160,6 +160,7 @@ CHAT_LINE_SPACING = 2          # Pixels between lines
 # General UI
 UI_SCALE = 1.0                 # Scale factor for UI elements
 UI_ANIMATION_SPEED = 300       # UI animation duration in milliseconds
+UI_GLOW_QUALITY = 1.0          # Scale for overlay glow layer counts (0.5 / 0.75 / 1.0) - lower on slow machines
 
 # Colors
 UI_PRIMARY_COLOR = (100, 150, 255)    # Main UI color (blue)
@@ -393,15 +393,20 @@ class EventHandler:
     
     def render_overlays(self):
         """Render any active overlays"""
+        # Sample the mouse once per frame and hand it to every overlay for hover checks
+        mouse_pos = None
+        if self.has_overlay_system and (self.showing_credits or self.showing_version):
+            mouse_pos = pygame.mouse.get_pos()
+        
         if self.showing_credits:
             if self.has_overlay_system:
-                self.credits_close_rect = self.overlay_system.draw_credits_overlay()
+                self.credits_close_rect = self.overlay_system.draw_credits_overlay(mouse_pos)
             else:
                 self._draw_fallback_credits()
         
         if self.showing_version:
             if self.has_overlay_system:
-                self.version_close_rect = self.overlay_system.draw_version_overlay()
+                self.version_close_rect = self.overlay_system.draw_version_overlay(mouse_pos)
             else:
                 self._draw_fallback_version()
         
@@ -1013,11 +1013,10 @@ class Game:
             bg_pos = (-self.camera.offset.x, -self.camera.offset.y)
             self.screen.blit(self.background, bg_pos)
             
-            # Draw buildings with optional debug hitboxes
-            for building in self.buildings:
-                building.draw(self.screen, self.camera, self.debug_hitboxes)
+            # Draw buildings - the manager culls off-screen buildings and blits the rest in one batch
+            self.building_manager.draw(self.screen, self.camera)
             
-            # Draw additional debug info if enabled
+            # Draw debug hitboxes on top if enabled
             if self.debug_hitboxes:
                 self.building_manager.draw_debug_info(self.screen, self.camera)
             
@@ -1256,30 +1255,32 @@ class Game:
 
     def _is_near_npc(self):
         """Check if player is near any NPC"""
-        player_pos = (self.player.rect.centerx, self.player.rect.centery)
+        player_x, player_y = self.player.rect.center
         for npc_obj in self.npcs:
-            npc_pos = (npc_obj.rect.centerx, npc_obj.rect.centery)
-            distance = ((player_pos[0] - npc_pos[0]) ** 2 + (player_pos[1] - npc_pos[1]) ** 2) ** 0.5
-            if distance <= 80:  # Slightly larger than interaction range
+            dx = player_x - npc_obj.rect.centerx
+            dy = player_y - npc_obj.rect.centery
+            if dx * dx + dy * dy <= 80 * 80:  # Slightly larger than interaction range
                 return True
         return False
 
     def _is_near_building(self):
         """Check if player is near any building (close enough to enter)"""
+        player_x, player_y = self.player.rect.center
         for building in self.buildings:
-            # Check if player is near building entrance
-            distance = ((self.player.rect.centerx - building.rect.centerx) ** 2 + 
-                    (self.player.rect.centery - building.rect.centery) ** 2) ** 0.5
-            if distance <= 100:  # Close enough to enter
+            # Check if player is near building entrance (squared distances, no sqrt)
+            dx = player_x - building.rect.centerx
+            dy = player_y - building.rect.centery
+            if dx * dx + dy * dy <= 100 * 100:  # Close enough to enter
                 return True
         return False
 
     def _is_far_from_buildings(self):
         """Check if player is far from all buildings"""
+        player_x, player_y = self.player.rect.center
         for building in self.buildings:
-            distance = ((self.player.rect.centerx - building.rect.centerx) ** 2 + 
-                    (self.player.rect.centery - building.rect.centery) ** 2) ** 0.5
-            if distance <= 300:  # Within reasonable distance
+            dx = player_x - building.rect.centerx
+            dy = player_y - building.rect.centery
+            if dx * dx + dy * dy <= 300 * 300:  # Within reasonable distance
                 return False
         return True
 
@@ -11,15 +11,148 @@ This module handles:
 
 import pygame
 import math
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional, List, Dict
 from config.settings import (
     ARROW_MAX_DISTANCE, ARROW_MIN_DISTANCE, ARROW_LOCK_DISTANCE,
     BUILDING_NAMES, ARROW_BASE_SIZE, COMPASS_SIZE
 )
 
+
+def _arrow_points(center_x, center_y, angle, size):
+    """Triangle (tip, base1, base2) for an arrow centred on (center_x, center_y)"""
+    head_length = size * 0.8
+    head_width = size * 0.5
+    base_angle1 = angle + 2.8  # About 160 degrees
+    base_angle2 = angle - 2.8  # About -160 degrees
+    return (center_x + math.cos(angle) * head_length,
+            center_y + math.sin(angle) * head_length,
+            center_x + math.cos(base_angle1) * head_width,
+            center_y + math.sin(base_angle1) * head_width,
+            center_x + math.cos(base_angle2) * head_width,
+            center_y + math.sin(base_angle2) * head_width)
+
+
+def _edge_position(dx, dy, screen_width, screen_height, margin):
+    """Arrow point on the margin-inset screen edge facing direction (dx, dy) from the screen centre"""
+    screen_center_x = screen_width // 2
+    screen_center_y = screen_height // 2
+    
+    # Normalize direction (kept so the truncated pixel positions match exactly)
+    length = math.sqrt(dx * dx + dy * dy)
+    dx /= length
+    dy /= length
+    
+    # Project onto the edge of the dominant axis
+    if abs(dx) > abs(dy):  # More horizontal movement
+        arrow_x = screen_width - margin if dx > 0 else margin
+        arrow_y = screen_center_y + (dy / dx) * (arrow_x - screen_center_x)
+    else:  # More vertical movement
+        arrow_y = screen_height - margin if dy > 0 else margin
+        arrow_x = screen_center_x + (dx / dy) * (arrow_y - screen_center_y)
+    
+    # Clamp to screen bounds - steep diagonals land in the corners
+    return (max(margin, min(screen_width - margin, arrow_x)),
+            max(margin, min(screen_height - margin, arrow_y)))
+
+
+def _locked_position(building_x, building_y, screen_width, screen_height, arrow_size):
+    """Arrow position hovering above an on-screen building, clamped to the screen otherwise"""
+    margin = arrow_size + 20  # Ensure arrow doesn't go off screen
+    if (margin < building_x < screen_width - margin and
+            margin < building_y < screen_height - margin):
+        return building_x, building_y - arrow_size - 30
+    return (max(margin, min(screen_width - margin, building_x)),
+            max(margin, min(screen_height - margin, building_y)))
+
+
+def _arrow_geometry(player_x, player_y, building_xs, building_ys, view_min_x, view_min_y,
+                    screen_width, screen_height, min_distance, max_distance, lock_distance,
+                    edge_margin):
+    """
+    Resolve arrow geometry for every candidate building in a single pass.
+    
+    Returns a list of (index, distance, arrow_x, arrow_y, angle, arrow_size,
+    size_factor, is_locked) for buildings inside the arrow distance band.
+    """
+    results = []
+    screen_center_x = screen_width // 2
+    screen_center_y = screen_height // 2
+    # Edge points depend only on the direction, so buildings sharing one this frame share the result
+    edge_positions = {}
+    
+    for i in range(len(building_xs)):
+        world_dx = building_xs[i] - player_x
+        world_dy = building_ys[i] - player_y
+        distance = math.sqrt(world_dx * world_dx + world_dy * world_dy)
+        
+        # Skip if too close or too far
+        if distance < min_distance or distance > max_distance:
+            continue
+        
+        building_screen_x = building_xs[i] - view_min_x
+        building_screen_y = building_ys[i] - view_min_y
+        
+        # Calculate size based on distance (closer = bigger), clamped to 0.2..1.0
+        size_factor = 1.0 - ((distance - min_distance) / (max_distance - min_distance))
+        size_factor = max(0.2, min(1.0, size_factor))
+        arrow_size = int(20 * size_factor)  # Base size 20 pixels
+        
+        is_locked = distance <= lock_distance
+        if is_locked:
+            # Lock onto building - arrow points directly to building position
+            locked_x, locked_y = _locked_position(building_screen_x, building_screen_y,
+                                                  screen_width, screen_height, arrow_size)
+            arrow_x = int(locked_x)
+            arrow_y = int(locked_y)
+            angle = math.atan2(building_screen_y - arrow_y, building_screen_x - arrow_x)
+            arrow_size = int(arrow_size * 1.3)  # 30% bigger when locked
+        else:
+            # Normal behavior - arrow at screen edge
+            dx = building_screen_x - screen_center_x
+            dy = building_screen_y - screen_center_y
+            if dx == 0 and dy == 0:
+                continue
+            edge = edge_positions.get((dx, dy))
+            if edge is None:
+                edge_x, edge_y = _edge_position(dx, dy, screen_width, screen_height, edge_margin)
+                edge = edge_positions[(dx, dy)] = (int(edge_x), int(edge_y))
+            arrow_x, arrow_y = edge
+            angle = math.atan2(dy, dx)
+        
+        results.append((i, distance, arrow_x, arrow_y, angle, arrow_size, size_factor, is_locked))
+    
+    return results
+
+
+def _brighten(color, multiplier):
+    """Scale an RGB colour, clamping each channel to 255"""
+    return tuple(min(255, int(c * multiplier)) for c in color)
+
+
+# Base arrow colours per building type
+_BASE_ARROW_COLORS = {
+    "house": (100, 150, 255),      # Light blue
+    "shop": (255, 150, 100),       # Light orange
+    "food_shop": (0, 153, 0),      # Light green
+    "town_hall": (255, 51, 51),    # Light red
+}
+_BASE_DEFAULT_COLOR = (150, 150, 150)  # Gray
+
+
 class BuildingArrowSystem:
     """Manages directional arrows pointing to buildings"""
     
+    # (building_type, is_locked) -> arrow_color; locked arrows are 20% brighter
+    _COLOR_TABLE = {
+        (building_type, is_locked): _brighten(color, 1.2 if is_locked else 1.0)
+        for building_type, color in _BASE_ARROW_COLORS.items()
+        for is_locked in (False, True)
+    }
+    _DEFAULT_COLORS = {
+        is_locked: _brighten(_BASE_DEFAULT_COLOR, 1.2 if is_locked else 1.0)
+        for is_locked in (False, True)
+    }
+    
     def __init__(self, font_small, font_chat, font_smallest):
         self.font_small = font_small
         self.font_chat = font_chat
@@ -35,6 +168,21 @@ class BuildingArrowSystem:
             "town_hall": "Town Hall",
             "food_shop": "Ramen Store"
         }
+        
+        # Pre-rendered compass (background, foreground), built lazily on first draw, never changes
+        self._compass_layers = None
+        
+        # Uniform grid of interactive buildings keyed by (cell_x, cell_y); with the
+        # cell size equal to max_distance the 3x3 block around the player covers
+        # every building that can show an arrow
+        self._grid: Dict[Tuple[int, int], List] = {}
+        self._grid_cell_size = self.max_distance
+        self._grid_version = None  # BuildingManager.layout_version the grid was built for
+        
+        # Pulse colours for locked arrows: one abs(sin) period sampled into 256 steps,
+        # filled lazily per base colour and indexed by the current tick count
+        self._pulse_lut: Dict[Tuple[int, int, int], List[Tuple[int, int, int]]] = {}
+        self._pulse_index_scale = 256 / (math.pi / 0.005)
     
     def calculate_distance(self, pos1, pos2):
         """Calculate distance between two points"""
@@ -48,24 +196,7 @@ class BuildingArrowSystem:
     
     def create_arrow_points(self, center_x, center_y, angle, size):
         """Create arrow points for drawing"""
-        # Arrow head points
-        head_length = size * 0.8
-        head_width = size * 0.5
-        
-        # Main arrow tip
-        tip_x = center_x + math.cos(angle) * head_length
-        tip_y = center_y + math.sin(angle) * head_length
-        
-        # Arrow base corners
-        base_angle1 = angle + 2.8  # About 160 degrees
-        base_angle2 = angle - 2.8  # About -160 degrees
-        
-        base1_x = center_x + math.cos(base_angle1) * head_width
-        base1_y = center_y + math.sin(base_angle1) * head_width
-        
-        base2_x = center_x + math.cos(base_angle2) * head_width
-        base2_y = center_y + math.sin(base_angle2) * head_width
-        
+        tip_x, tip_y, base1_x, base1_y, base2_x, base2_y = _arrow_points(center_x, center_y, angle, size)
         return [(tip_x, tip_y), (base1_x, base1_y), (base2_x, base2_y)]
     
     def get_screen_edge_position(self, player_screen_pos, building_screen_pos, screen_size, margin=60):
@@ -78,59 +209,57 @@ class BuildingArrowSystem:
         dx = building_screen_pos[0] - screen_center_x
         dy = building_screen_pos[1] - screen_center_y
         
-        # Normalize direction
-        length = math.sqrt(dx*dx + dy*dy)
-        if length == 0:
+        if dx == 0 and dy == 0:
             return None
         
-        dx /= length
-        dy /= length
-        
-        # Determine which screen edge to use based on direction
-        arrow_x = screen_center_x
-        arrow_y = screen_center_y
-        
-        # Calculate intersection with screen edges
-        if abs(dx) > abs(dy):  # More horizontal movement
-            if dx > 0:  # Building is to the right
-                arrow_x = screen_width - margin
-                arrow_y = screen_center_y + (dy / dx) * (screen_width - margin - screen_center_x)
-            else:  # Building is to the left
-                arrow_x = margin
-                arrow_y = screen_center_y + (dy / dx) * (margin - screen_center_x)
-        else:  # More vertical movement
-            if dy > 0:  # Building is below
-                arrow_y = screen_height - margin
-                arrow_x = screen_center_x + (dx / dy) * (screen_height - margin - screen_center_y)
-            else:  # Building is above
-                arrow_y = margin
-                arrow_x = screen_center_x + (dx / dy) * (margin - screen_center_y)
-        
-        # Clamp to screen bounds
-        arrow_x = max(margin, min(screen_width - margin, arrow_x))
-        arrow_y = max(margin, min(screen_height - margin, arrow_y))
-        
+        arrow_x, arrow_y = _edge_position(dx, dy, screen_width, screen_height, margin)
         return (int(arrow_x), int(arrow_y))
     
     def get_locked_arrow_position(self, building_screen_pos, screen_size, arrow_size):
         """Get position for locked arrow directly pointing to building on screen"""
         screen_width, screen_height = screen_size
         building_x, building_y = building_screen_pos
+        return _locked_position(building_x, building_y, screen_width, screen_height, arrow_size)
+    
+    def _get_pulse_color(self, arrow_color, ticks):
+        """Pulsed version of arrow_color for the given tick count"""
+        pulse_colors = self._pulse_lut.get(arrow_color)
+        if pulse_colors is None:
+            pulse_colors = []
+            for step in range(256):
+                pulse = abs(math.sin(step * math.pi / 256)) * 0.3 + 0.7
+                pulse_colors.append(tuple(int(c * pulse) for c in arrow_color))
+            self._pulse_lut[arrow_color] = pulse_colors
+        return pulse_colors[int(ticks * self._pulse_index_scale) & 0xFF]
+    
+    def rebuild_grid(self, buildings, layout_version=None):
+        """Re-bucket buildings into the arrow grid (done automatically when layout_version changes)"""
+        self._grid = {}
+        cell_size = self._grid_cell_size
+        for order, building in enumerate(buildings):
+            # SKIP NON-INTERACTIVE BUILDINGS (like fountains)
+            if not building.interactive:
+                continue
+            cell = (building.rect.centerx // cell_size, building.rect.centery // cell_size)
+            self._grid.setdefault(cell, []).append((order, building))
+        self._grid_version = layout_version
+    
+    def _get_nearby_buildings(self, buildings, player_world_pos, layout_version):
+        """Interactive buildings in the 3x3 grid cells around the player, in list order"""
+        # The building manager bumps its layout version on every add, remove and move
+        if self._grid_version != layout_version:
+            self.rebuild_grid(buildings, layout_version)
         
-        # Check if building is visible on screen
-        margin = arrow_size + 20  # Ensure arrow doesn't go off screen
-        
-        # If building is on screen, position arrow slightly offset from building
-        if (margin < building_x < screen_width - margin and 
-            margin < building_y < screen_height - margin):
-            # Position arrow above the building
-            return (building_x, building_y - arrow_size - 30)
-        
-        # If building is off-screen, still lock to its position but clamp to screen edges
-        clamped_x = max(margin, min(screen_width - margin, building_x))
-        clamped_y = max(margin, min(screen_height - margin, building_y))
+        cell_size = self._grid_cell_size
+        cell_x = player_world_pos[0] // cell_size
+        cell_y = player_world_pos[1] // cell_size
         
-        return (clamped_x, clamped_y)
+        nearby = []
+        for offset_x in (-1, 0, 1):
+            for offset_y in (-1, 0, 1):
+                nearby.extend(self._grid.get((cell_x + offset_x, cell_y + offset_y), ()))
+        nearby.sort(key=lambda entry: entry[0])
+        return [building for _, building in nearby]
     
     def draw_building_arrows(self, surface, player, buildings, camera, building_manager):
         """Draw arrows pointing to all buildings (excluding non-interactive decorative buildings)"""
@@ -139,94 +268,42 @@ class BuildingArrowSystem:
             return
         
         screen_size = (surface.get_width(), surface.get_height())
-        screen_center_x = screen_size[0] // 2
-        screen_center_y = screen_size[1] // 2
         player_world_pos = (player.rect.centerx, player.rect.centery)
         
-        for building in buildings:
-            # SKIP NON-INTERACTIVE BUILDINGS (like fountains)
-            if not building.interactive:
-                continue
-                
-            building_world_pos = (building.rect.centerx, building.rect.centery)
-            distance = self.calculate_distance(player_world_pos, building_world_pos)
-            
-            # Skip if too close or too far
-            if distance < self.min_distance or distance > self.max_distance:
-                continue
-            
-            # Rest of the method remains the same...
-            # Calculate building position on screen using camera
-            building_screen_rect = camera.apply(building.rect)
-            building_screen_pos = (building_screen_rect.centerx, building_screen_rect.centery)
-            
-            # Calculate size based on distance (closer = bigger)
-            size_factor = 1.0 - ((distance - self.min_distance) / (self.max_distance - self.min_distance))
-            size_factor = max(0.2, min(1.0, size_factor))  # Clamp between 0.2 and 1.0
-            
-            arrow_size = int(20 * size_factor)  # Base size 20 pixels
-            text_size_multiplier = size_factor
-            
-            # Determine arrow behavior based on distance
-            is_locked = distance <= self.lock_distance
-            
-            if is_locked:
-                # Lock onto building - arrow points directly to building position
-                arrow_pos = self.get_locked_arrow_position(building_screen_pos, screen_size, arrow_size)
-                # Calculate angle from arrow position to building
-                angle = self.calculate_angle(arrow_pos, building_screen_pos)
-                
-                # Make locked arrows more prominent
-                arrow_size = int(arrow_size * 1.3)  # 30% bigger when locked
-                
-            else:
-                # Normal behavior - arrow at screen edge
-                arrow_pos = self.get_screen_edge_position(
-                    (screen_center_x, screen_center_y), building_screen_pos, screen_size
-                )
-                
-                if not arrow_pos:
-                    continue
-                
-                # Calculate angle from screen center to building screen position
-                angle = self.calculate_angle((screen_center_x, screen_center_y), building_screen_pos)
+        # Only buildings in the grid cells around the player can be within range
+        targets = self._get_nearby_buildings(buildings, player_world_pos, building_manager.layout_version)
+        
+        # Screen positions are world positions shifted by the view origin, so no
+        # per-building camera.apply (and Rect allocation) is needed
+        view_min_x, view_min_y, _, _ = camera.world_bounds()
+        
+        # Resolve all arrow geometry in one batched call; only drawing stays per-building
+        geometry = _arrow_geometry(
+            player_world_pos[0], player_world_pos[1],
+            [building.rect.centerx for building in targets],
+            [building.rect.centery for building in targets],
+            view_min_x, view_min_y, screen_size[0], screen_size[1],
+            self.min_distance, self.max_distance, self.lock_distance, 60
+        )
+        
+        ticks = pygame.time.get_ticks()
+        
+        for index, distance, arrow_x, arrow_y, angle, arrow_size, text_size_multiplier, is_locked in geometry:
+            building = targets[index]
+            arrow_pos = (arrow_x, arrow_y)
             
             # Draw arrow
             arrow_points = self.create_arrow_points(arrow_pos[0], arrow_pos[1], angle, arrow_size)
             
-            # Arrow colors based on building type (brighter when locked)
-            brightness_multiplier = 1.2 if is_locked else 1.0
-            
-            if building.building_type == "house":
-                base_arrow_color = (100, 150, 255)  # Light blue
-                base_outline_color = (50, 100, 200)  # Darker blue
-            elif building.building_type == "shop":
-                base_arrow_color = (255, 150, 100)  # Light orange
-                base_outline_color = (200, 100, 50)  # Darker orange
-            elif building.building_type == "food_shop":
-                base_arrow_color = (0, 153, 0)  # Light green
-                base_outline_color = (0, 102, 0)  # Darker Green
-            elif building.building_type == "town_hall":
-                base_arrow_color = (255, 51, 51) # Light red
-                base_outline_color = (200, 0, 0) # Darker red
-            else:
-                base_arrow_color = (150, 150, 150)  # Gray
-                base_outline_color = (100, 100, 100)  # Darker gray
-            
-            # Apply brightness multiplier for locked arrows
-            arrow_color = tuple(min(255, int(c * brightness_multiplier)) for c in base_arrow_color)
-            outline_color = tuple(min(255, int(c * brightness_multiplier)) for c in base_outline_color)
+            # Arrow color based on building type (brighter when locked)
+            arrow_color = self._COLOR_TABLE.get(
+                (building.building_type, is_locked), self._DEFAULT_COLORS[is_locked]
+            )
             
-            # Draw arrow with outline (thicker outline when locked)
-            outline_width = 3 if is_locked else 2
-            pygame.draw.polygon(surface, outline_color, arrow_points)
-            pygame.draw.polygon(surface, arrow_color, arrow_points, 0)
-            
-            # Add pulsing effect for locked arrows
+            # Add pulsing effect for locked arrows (the pulse colour replaces the base fill)
             if is_locked:
-                pulse = abs(math.sin(pygame.time.get_ticks() * 0.005)) * 0.3 + 0.7
-                pulse_color = tuple(int(c * pulse) for c in arrow_color)
-                pygame.draw.polygon(surface, pulse_color, arrow_points, 0)
+                arrow_color = self._get_pulse_color(arrow_color, ticks)
+            pygame.draw.polygon(surface, arrow_color, arrow_points)
             
             # Convert distance to "tiles" (assuming ~32 pixels per tile)
             distance_in_tiles = int(distance / 32)
@@ -294,27 +371,34 @@ class BuildingArrowSystem:
             bg_surface = pygame.Surface((name_bg_rect.width, name_bg_rect.height))
             bg_surface.set_alpha(bg_alpha)
             bg_surface.fill((0, 0, 0))
-            surface.blit(bg_surface, (name_bg_rect.x, name_bg_rect.y))
             
-            # Draw text
-            surface.blit(name_surface, (name_x, name_y))
-            surface.blit(distance_surface, (distance_x, distance_y))
+            # Blit this building's label right after its arrow so arrows and labels stack per building
+            surface.blits(((bg_surface, (name_bg_rect.x, name_bg_rect.y)),
+                           (name_surface, (name_x, name_y)),
+                           (distance_surface, (distance_x, distance_y))), doreturn=False)
     
     def draw_compass(self, surface, player_direction=(0, -1)):
         """Draw a small compass at the top-left corner"""
+        if self._compass_layers is None:
+            self._compass_layers = self._build_compass_layers()
+        compass_bg, compass_surface = self._compass_layers
+        surface.blit(compass_bg, (20, 20))
+        surface.blit(compass_surface, (20, 20))
+    
+    def _build_compass_layers(self):
+        """Render the static compass once, as its translucent background and its foreground (circle, letters, needle)"""
         compass_size = 80
-        compass_x = 20
-        compass_y = 20
-        compass_center = (compass_x + compass_size // 2, compass_y + compass_size // 2)
+        compass_center = (compass_size // 2, compass_size // 2)
         
-        # Create semi-transparent background
+        # Semi-transparent background, kept separate so the letters blend over it on screen
         compass_bg = pygame.Surface((compass_size, compass_size))
         compass_bg.set_alpha(120)
         compass_bg.fill((0, 0, 0))
-        surface.blit(compass_bg, (compass_x, compass_y))
+        
+        compass_surface = pygame.Surface((compass_size, compass_size), pygame.SRCALPHA)
         
         # Draw compass circle outline
-        pygame.draw.circle(surface, (200, 200, 200), compass_center, compass_size // 2 - 2, 2)
+        pygame.draw.circle(compass_surface, (200, 200, 200), compass_center, compass_size // 2 - 2, 2)
         
         # Draw cardinal directions
         directions = [
@@ -334,7 +418,9 @@ class BuildingArrowSystem:
             font = self.font_chat
             text_surface = font.render(label, True, color)
             text_rect = text_surface.get_rect(center=(label_x, label_y))
-            surface.blit(text_surface, text_rect)
+            # Copy the antialiased pixels as they are - alpha blending onto the transparent
+            # layer would darken the letter edges
+            compass_surface.blit(text_surface, text_rect, special_flags=pygame.BLEND_RGBA_MAX)
         
         # Draw compass needle pointing north
         needle_length = compass_size // 2 - 20
@@ -342,7 +428,7 @@ class BuildingArrowSystem:
         needle_end_y = compass_center[1] + -1 * needle_length
         
         # Draw needle (thicker line)
-        pygame.draw.line(surface, (255, 50, 50), compass_center, 
+        pygame.draw.line(compass_surface, (255, 50, 50), compass_center, 
                         (needle_end_x, needle_end_y), 3)
         
         # Draw needle tip (small triangle)
@@ -352,7 +438,9 @@ class BuildingArrowSystem:
             (needle_end_x - tip_size//2, needle_end_y + tip_size//2),
             (needle_end_x + tip_size//2, needle_end_y + tip_size//2)
         ]
-        pygame.draw.polygon(surface, (255, 50, 50), tip_points)
+        pygame.draw.polygon(compass_surface, (255, 50, 50), tip_points)
         
         # Draw center dot
-        pygame.draw.circle(surface, (255, 255, 255), compass_center, 3)
\ No newline at end of file
+        pygame.draw.circle(compass_surface, (255, 255, 255), compass_center, 3)
+        
+        return compass_bg, compass_surface
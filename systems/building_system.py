@@ -1,8 +1,41 @@
 import pygame
-from typing import List, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple
 from .collision_system import CollisionMixin, InteriorWall
 from world.interior import InteriorManager
 from .interaction_system import BuildingInteractionSystem
+from .spatial_index import QuadTree, SpatialHash
+
+# NumPy is optional - when it is installed pairwise overlap checks are
+# vectorised, otherwise the spatial index broad-phase is used
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Below this many buildings a plain loop over the rects beats both the NumPy
+# passes and the spatial index - their fixed per-call setup dwarfs a handful
+# of colliderect calls
+_INDEXED_MIN_BUILDINGS = 64
+
+
+def _nearest_index(centers, x, y):
+    """Row of centers ((n, 2) int64) closest to (x, y); ties go to the first row"""
+    offsets = centers - (x, y)
+    return int((offsets * offsets).sum(axis=1).argmin())
+
+
+def _nearest_indices(centers, points):
+    """Closest row of centers for every row of points ((m, 2) int64)"""
+    offsets = centers[None, :, :] - points[:, None, :]
+    return (offsets * offsets).sum(axis=2).argmin(axis=1)
+
+
+def _first_overlap(boxes, left, top, right, bottom):
+    """First row of boxes ((n, 4) int64 edges) overlapping the box, or -1"""
+    hits = np.flatnonzero((boxes[:, 0] < right) & (left < boxes[:, 2]) &
+                          (boxes[:, 1] < bottom) & (top < boxes[:, 3]))
+    return int(hits[0]) if hits.size else -1
 
 
 class BuildingConfig:
@@ -94,42 +127,113 @@ class BuildingConfig:
     }
     
     @classmethod
-    def get_config(cls, building_type: str) -> Dict:
-        """Get configuration for a building type"""
+    def get_config(cls, building_type: str) -> Mapping:
+        """Get configuration for a building type (shared, read-only)"""
         return cls.BUILDING_CONFIGS.get(building_type, cls.DEFAULT_CONFIG)
+    
+    @staticmethod
+    def derive(config: Mapping, overrides: Dict) -> Mapping:
+        """Get a read-only copy of config with some values replaced - shared configs are never mutated"""
+        return _freeze_config({**config, **overrides})
+
+
+def _freeze_config(config: Dict) -> Mapping:
+    """Wrap a config (and its hitbox_padding) in read-only views so it can be shared safely"""
+    frozen = dict(config)
+    if isinstance(frozen.get("hitbox_padding"), dict):
+        frozen["hitbox_padding"] = MappingProxyType(dict(frozen["hitbox_padding"]))
+    return MappingProxyType(frozen)
+
+
+# Every building of a type shares one config instance, so freeze them. The flat
+# module-level lookup lets Building.__init__ skip the classmethod dispatch.
+_CONFIG_BY_TYPE: Dict[str, Mapping] = {
+    building_type: _freeze_config(config)
+    for building_type, config in BuildingConfig.BUILDING_CONFIGS.items()
+}
+_DEFAULT_CONFIG: Mapping = _freeze_config(BuildingConfig.DEFAULT_CONFIG)
+BuildingConfig.BUILDING_CONFIGS = _CONFIG_BY_TYPE
+BuildingConfig.DEFAULT_CONFIG = _DEFAULT_CONFIG
+
+
+# How far (px) debug labels/entry zones may reach outside a building rect; used
+# to cull the debug overlay without clipping anything that is partly on screen
+_DEBUG_CULL_MARGIN = 100
+
+# (source image, scale factor) -> scaled copy. Buildings never draw on their
+# image, so every building of a type can share one scaled surface
+_SCALED_IMAGES: Dict[Tuple[pygame.Surface, float], pygame.Surface] = {}
+
+
+def _get_scaled_image(image: pygame.Surface, scale_factor: float) -> pygame.Surface:
+    """Get image scaled by scale_factor, scaling each source image only once"""
+    key = (image, scale_factor)
+    scaled = _SCALED_IMAGES.get(key)
+    if scaled is None:
+        original_size = image.get_size()
+        new_size = (int(original_size[0] * scale_factor), int(original_size[1] * scale_factor))
+        scaled = _SCALED_IMAGES[key] = pygame.transform.scale(image, new_size)
+    return scaled
+
+
+# Debug overlay font (created on first use, after pygame.font is initialised)
+# and the rendered building-type labels, which never change
+_debug_font: Optional[pygame.font.Font] = None
+_DEBUG_LABELS: Dict[str, pygame.Surface] = {}
+
+
+def _get_debug_label(text: str) -> pygame.Surface:
+    """Get the yellow debug label for text, rendering it only once"""
+    global _debug_font
+    label = _DEBUG_LABELS.get(text)
+    if label is None:
+        if _debug_font is None:
+            _debug_font = pygame.font.Font(None, 24)
+        label = _DEBUG_LABELS[text] = _debug_font.render(text, True, (255, 255, 0))
+    return label
 
 
 class Building(CollisionMixin):
     """Main building class with modular components - now supports decorative buildings"""
     
-    def __init__(self, x: int, y: int, building_type: str, assets):
+    __slots__ = (
+        'x', 'y', 'building_type', 'config', 'original_image', 'image', 'rect',
+        'can_enter', 'is_solid', 'has_interior', 'interactive', 'interior_size', 'furniture',
+        'npc_change_callback', 'hitbox', '_pad_x', '_pad_y', 'south_interaction_zone',
+        'interaction_zone', 'interior_manager'
+    )
+    
+    def __init__(self, x: int, y: int, building_type: str, assets, config: Optional[Mapping] = None):
         self.x = x
         self.y = y
         self.building_type = building_type
-        self.config = BuildingConfig.get_config(building_type)
+        # Factories pass an already-derived config so the image is only scaled once
+        if config is None:
+            config = _CONFIG_BY_TYPE.get(building_type, _DEFAULT_CONFIG)
+        self.config = config
         
         # Load building image and apply scaling if needed
         self.original_image = assets["building"][building_type][0]
-        scale_factor = self.config.get("scale_factor", 1.0)
+        scale_factor = config.get("scale_factor", 1.0)
         
         if scale_factor != 1.0:
-            # Scale the image
-            original_size = self.original_image.get_size()
-            new_size = (int(original_size[0] * scale_factor), int(original_size[1] * scale_factor))
-            self.image = pygame.transform.scale(self.original_image, new_size)
+            self.image = _get_scaled_image(self.original_image, scale_factor)
         else:
             self.image = self.original_image
             
         self.rect = self.image.get_rect(topleft=(x, y))
         
         # Initialize core properties from config
-        self.can_enter = self.config["can_enter"]
-        self.is_solid = self.config["is_solid"]
-        self.has_interior = self.config["has_interior"]
-        self.interactive = self.config["interactive"]
-        self.interior_size = self.config["interior_size"]
+        self.can_enter = config["can_enter"]
+        self.is_solid = config["is_solid"]
+        self.has_interior = config["has_interior"]
+        self.interactive = config["interactive"]
+        self.interior_size = config["interior_size"]
         self.furniture = []
         
+        # Called when NPCs enter/leave so owners can invalidate cached info
+        self.npc_change_callback = None
+        
         # Initialize collision areas
         self._setup_collision_areas()
         
@@ -142,7 +246,7 @@ class Building(CollisionMixin):
     
     def get_furniture_list(self):
         # Return furniture from the interior renderer if it exists
-        if hasattr(self, 'interior_manager') and self.interior_manager and hasattr(self.interior_manager, 'renderer'):
+        if self.interior_manager and hasattr(self.interior_manager, 'renderer'):
             return self.interior_manager.renderer.furniture
         return self.furniture 
     
@@ -157,6 +261,10 @@ class Building(CollisionMixin):
         hitbox_y = self.rect.y + padding["y"]
         self.hitbox = pygame.Rect(hitbox_x, hitbox_y, hitbox_width, hitbox_height)
         
+        # Offsets reused by update_position so moving never rebuilds the Rects
+        self._pad_x = padding["x"]
+        self._pad_y = padding["y"]
+        
         # Setup interaction zone ONLY at south side (front door) for enterable buildings
         if self.interactive and self.can_enter:
             interaction_padding = self.config["interaction_padding"]
@@ -181,7 +289,12 @@ class Building(CollisionMixin):
         self.x = x
         self.y = y
         self.rect.topleft = (x, y)
-        self._setup_collision_areas()
+        
+        # Sizes don't change when moving, so shift the existing Rects in place
+        hitbox = self.hitbox
+        hitbox.topleft = (x + self._pad_x, y + self._pad_y)
+        if self.south_interaction_zone:
+            self.south_interaction_zone.topleft = hitbox.bottomleft
         
         # Ensure interaction_zone stays None
         self.interaction_zone = None
@@ -209,7 +322,7 @@ class Building(CollisionMixin):
         if not self.interactive or not self.can_enter:
             return False
         
-        if hasattr(self, 'south_interaction_zone') and self.south_interaction_zone:
+        if self.south_interaction_zone:
             return self.south_interaction_zone.colliderect(other_rect)
         
         return False
@@ -229,8 +342,7 @@ class Building(CollisionMixin):
     def draw(self, surface: pygame.Surface, camera, debug_hitboxes: bool = False):
         """Draw the building and optionally show debug info"""
         # Draw the building image
-        draw_rect = camera.apply(self.rect)
-        surface.blit(self.image, draw_rect)
+        surface.blit(self.image, camera.apply(self.rect))
         
         if debug_hitboxes:
             self._draw_debug_info(surface, camera)
@@ -242,14 +354,13 @@ class Building(CollisionMixin):
         pygame.draw.rect(surface, (255, 0, 0), hitbox_screen, 2)
         
         # ONLY draw south interaction zone - nothing else
-        if hasattr(self, 'south_interaction_zone') and self.south_interaction_zone:
+        if self.south_interaction_zone:
             interaction_screen = camera.apply(self.south_interaction_zone)
             pygame.draw.rect(surface, (0, 255, 0), interaction_screen, 2)
         
         # Draw building type label for interactive buildings
         if self.interactive:
-            font = pygame.font.Font(None, 24)
-            label = font.render(self.building_type, True, (255, 255, 0))
+            label = _get_debug_label(self.building_type)
             label_pos = (hitbox_screen.centerx - label.get_width() // 2, hitbox_screen.top - 25)
             surface.blit(label, label_pos)
     
@@ -269,13 +380,19 @@ class Building(CollisionMixin):
         """Add an NPC to this building"""
         if not self.can_enter or not self.interior_manager:
             return False
-        return self.interior_manager.add_npc(npc)
+        added = self.interior_manager.add_npc(npc)
+        if added and self.npc_change_callback:
+            self.npc_change_callback()
+        return added
     
     def remove_npc(self, npc) -> bool:
         """Remove an NPC from this building"""
         if not self.interior_manager:
             return False
-        return self.interior_manager.remove_npc(npc)
+        removed = self.interior_manager.remove_npc(npc)
+        if removed and self.npc_change_callback:
+            self.npc_change_callback()
+        return removed
     
     def get_npc_count(self) -> int:
         """Get the number of NPCs currently in this building"""
@@ -327,22 +444,6 @@ class Building(CollisionMixin):
             "at_capacity": self.is_at_npc_capacity(),
             "config": self.config
         }
-    
-    def check_collision(self, other_rect: pygame.Rect) -> bool:
-        """Enhanced collision detection - ensure it works properly"""
-        # Make sure hitbox exists and is valid
-        if not hasattr(self, 'hitbox') or self.hitbox is None:
-            print(f"Warning: Building {self.building_type} has no hitbox!")
-            return False
-        
-        # Debug output for fountain collisions
-        if self.building_type == "fountain":
-            collision = self.hitbox.colliderect(other_rect)
-            if collision:
-                pass
-            return collision
-        
-        return self.hitbox.colliderect(other_rect)
 
 
 class BuildingManager:
@@ -361,9 +462,107 @@ class BuildingManager:
         
         # Set up callbacks for system integration
         self.interaction_system.add_transition_callback(self._on_transition)
+        
+        # Spatial index over building rects for position queries, rebuilt lazily after
+        # removals/moves and extended in place when a building is appended
+        self._spatial_index = None  # QuadTree or SpatialHash, see _get_index
+        self._index_dirty = True
+        self._index_search_radius = 1
+        # Struct-of-arrays copies of the hot geometry when NumPy is available:
+        # (n, 4) rect edges (left, top, right, bottom) and (n, 2) rect centers
+        self._aabb = None
+        self._centers = None
+        # Indices of buildings the player can walk into, plus their south entry zone
+        # edges as an (n, 4) array when NumPy is available, otherwise a uniform grid
+        self._entry_ids: List[int] = []
+        self._entry_zones = None
+        self._entry_index: Optional[SpatialHash] = None
+        # Bumped whenever buildings are added, removed or moved, so views that bucket
+        # buildings (e.g. the arrow grid) know when to rebuild
+        self.layout_version = 0
+        
+        # get_building_info / get_system_info results, reused until _info_version changes
+        self._info_version = 0
+        self._building_info_cache: Optional[Tuple[int, List[Dict]]] = None
+        self._system_info_cache: Optional[Tuple[int, Dict]] = None
+        for building in buildings:
+            building.npc_change_callback = self._invalidate_info
+        
+        # building_type -> buildings of that type, in list order
+        self._by_type: Dict[str, List[Building]] = {}
+        for building in buildings:
+            self._by_type.setdefault(building.building_type, []).append(building)
+    
+    def _invalidate_info(self):
+        """Mark cached building/system info as stale"""
+        self._info_version += 1
+    
+    def _get_index(self):
+        """Get the spatial index, rebuilding it if buildings changed since the last query"""
+        if self._index_dirty or self._spatial_index is None:
+            items = [(building.rect, i) for i, building in enumerate(self.buildings)]
+            # Similar-sized buildings (the usual town layout) suit a flat uniform
+            # grid; mixed sizes would make grid cells too coarse, so use a quadtree
+            sizes = [max(rect.width, rect.height) for rect, _ in items]
+            if sizes and max(sizes) <= 2 * max(1, min(sizes)):
+                self._spatial_index = SpatialHash.from_items(items)
+            else:
+                self._spatial_index = QuadTree.from_items(items)
+            # Start nearest-building searches at roughly one building size
+            if self.buildings:
+                total_size = sum(b.rect.width + b.rect.height for b in self.buildings)
+                self._index_search_radius = max(1, total_size // (2 * len(self.buildings)))
+            self._entry_ids = [i for i, b in enumerate(self.buildings) if self._has_entry_zone(b)]
+            if np is not None:
+                # int64 so squared distances cannot overflow on large maps
+                self._aabb = np.array(
+                    [(b.rect.left, b.rect.top, b.rect.right, b.rect.bottom) for b in self.buildings],
+                    dtype=np.int64
+                ).reshape(-1, 4)
+                self._centers = np.array(
+                    [(b.rect.centerx, b.rect.centery) for b in self.buildings], dtype=np.int64
+                ).reshape(-1, 2)
+                zones = [self.buildings[i].south_interaction_zone for i in self._entry_ids]
+                self._entry_zones = np.array(
+                    [(z.left, z.top, z.right, z.bottom) for z in zones], dtype=np.int64
+                ).reshape(-1, 4)
+            else:
+                self._entry_index = SpatialHash.from_items(
+                    (self.buildings[i].south_interaction_zone, i) for i in self._entry_ids
+                )
+            self._index_dirty = False
+        return self._spatial_index
+    
+    def _extend_index(self, building: Building):
+        """Add a just-appended building to a live index instead of scheduling a full rebuild"""
+        if self._index_dirty or self._spatial_index is None:
+            self._index_dirty = True
+            return
+        # Appending keeps every existing index valid, so only the new entry is inserted
+        rect = building.rect
+        self._spatial_index.insert(rect, len(self.buildings) - 1)
+        if self._aabb is not None:
+            self._aabb = np.vstack((self._aabb, [(rect.left, rect.top, rect.right, rect.bottom)]))
+            self._centers = np.vstack((self._centers, [rect.center]))
+        if self._has_entry_zone(building):
+            self._entry_ids.append(len(self.buildings) - 1)
+            zone = building.south_interaction_zone
+            if self._entry_zones is not None:
+                self._entry_zones = np.vstack((self._entry_zones, [(zone.left, zone.top, zone.right, zone.bottom)]))
+            else:
+                self._entry_index.insert(zone, len(self.buildings) - 1)
+    
+    @staticmethod
+    def _has_entry_zone(building: Building) -> bool:
+        """Whether check_building_entry can ever match this building"""
+        zone = building.south_interaction_zone
+        # Zero-size rects never collide, same as colliderect
+        return (building.interactive and building.can_enter and
+                zone is not None and zone.width > 0 and zone.height > 0)
     
     def _on_transition(self, transition_type: str, building=None):
         """Handle transition events between interior/exterior"""
+        self._invalidate_info()
         if transition_type == "enter" and building:
             print(f"Transition: Entered {building.building_type}")
         elif transition_type == "exit" and building:
@@ -371,10 +570,28 @@ class BuildingManager:
     
     def check_building_entry(self, player_rect: pygame.Rect) -> Optional[Building]:
         """Check if player can enter any building - only interactive buildings"""
-        for building in self.buildings:
-            if building.interactive and building.can_enter and building.check_interaction_range(player_rect):
-                return building
-        return None
+        self._get_index()
+        if player_rect.width <= 0 or player_rect.height <= 0:
+            return None  # Zero-size rects never collide, same as colliderect
+        
+        if len(self._entry_ids) < _INDEXED_MIN_BUILDINGS:
+            # A small town is cheaper to walk than to hand to NumPy or the grid
+            buildings = self.buildings
+            for i in self._entry_ids:
+                if buildings[i].south_interaction_zone.colliderect(player_rect):
+                    return buildings[i]
+            return None
+        
+        if self._entry_zones is not None:
+            # One pass over the entry zone edges instead of a per-building loop
+            hit = _first_overlap(self._entry_zones, player_rect.left, player_rect.top,
+                                 player_rect.right, player_rect.bottom)
+            return self.buildings[self._entry_ids[hit]] if hit >= 0 else None
+        
+        # Only entry zones in the grid cells around the player are tested; the
+        # lowest index wins so list order still decides between overlapping zones
+        hits = self._entry_index.query(player_rect)
+        return self.buildings[min(hits)] if hits else None
     
     def enter_building(self, building: Building, player) -> bool:
         """Enter a building interior - only works for interactive buildings"""
@@ -392,22 +609,22 @@ class BuildingManager:
     
     def get_interior_collision_walls(self) -> List[InteriorWall]:
         """Get collision walls for current interior"""
-        current_interior = self.get_current_interior()
+        current_interior = self.interaction_system.current_interior
         return current_interior.get_interior_walls() if current_interior else []
     
     def get_interior_furniture_collisions(self) -> List:
         """Get furniture collision objects for current interior"""
-        current_interior = self.get_current_interior()
+        current_interior = self.interaction_system.current_interior
         return current_interior.get_interior_furniture_collisions() if current_interior else []
     
     def check_furniture_interaction(self, player_rect: pygame.Rect):
         """Check if player can interact with any furniture in current interior"""
-        current_interior = self.get_current_interior()
+        current_interior = self.interaction_system.current_interior
         return current_interior.check_furniture_interaction(player_rect) if current_interior else None
     
     def get_interactable_furniture(self, player_rect: pygame.Rect):
         """Get all furniture items the player can interact with in current interior"""
-        current_interior = self.get_current_interior()
+        current_interior = self.interaction_system.current_interior
         return current_interior.get_interactable_furniture(player_rect) if current_interior else []
     
     def is_inside_building(self) -> bool:
@@ -416,72 +633,136 @@ class BuildingManager:
     
     def get_current_interior(self) -> Optional[Building]:
         """Get the current interior building"""
-        return self.interaction_system.get_current_interior()
+        return self.interaction_system.current_interior
     
     def get_building_info(self) -> List[Dict]:
-        """Get information about all buildings and their NPC counts"""
-        return [
-            {
+        """Get information about all buildings and their NPC counts (cached - do not mutate)"""
+        if self._building_info_cache and self._building_info_cache[0] == self._info_version:
+            return self._building_info_cache[1]
+        
+        building_info = []
+        append = building_info.append
+        for building in self.buildings:
+            interior_manager = building.interior_manager
+            append({
                 'type': building.building_type,
                 'position': (building.x, building.y),
-                'npc_count': building.get_npc_count(),
+                'npc_count': interior_manager.get_npc_count() if interior_manager else 0,
                 'max_npcs': building.config["max_npcs"],
                 'can_enter': building.can_enter,
                 'has_interior': building.has_interior,
                 'interactive': building.interactive,
                 'is_solid': building.is_solid
-            }
-            for building in self.buildings
-        ]
+            })
+        self._building_info_cache = (self._info_version, building_info)
+        return building_info
     
     def add_building(self, building: Building):
         """Add a new building to the system"""
         if building not in self.buildings:
             self.buildings.append(building)
+            self._by_type.setdefault(building.building_type, []).append(building)
+            self._extend_index(building)
+            self.layout_version += 1
+            building.npc_change_callback = self._invalidate_info
+            self._invalidate_info()
             # Only add interactive buildings to interaction system
             if building.interactive:
-                # Recreate interaction zones to include new building
-                interactive_buildings = [b for b in self.buildings if b.interactive]
-                self.interaction_system = BuildingInteractionSystem(interactive_buildings)
+                # Add just this building's zone - the others (and any transition state) are kept
+                self.interaction_system.add_zone_for(building)
+                # Building handles its own interaction zone, same as in __init__
+                building.interaction_zone = None
     
     def remove_building(self, building: Building) -> bool:
         """Remove a building from the system"""
         if building in self.buildings:
             self.buildings.remove(building)
-            # Recreate interaction zones for interactive buildings
-            interactive_buildings = [b for b in self.buildings if b.interactive]
-            self.interaction_system = BuildingInteractionSystem(interactive_buildings)
+            self._by_type[building.building_type].remove(building)
+            self._index_dirty = True
+            self.layout_version += 1
+            building.npc_change_callback = None
+            self._invalidate_info()
+            # Drop just this building's interaction zone
+            self.interaction_system.remove_zone_for(building)
             return True
         return False
     
     def update_building_positions(self):
         """Update all building positions (call if buildings move)"""
+        self._index_dirty = True
+        self.layout_version += 1
+        self._invalidate_info()
         self.interaction_system.update_building_positions()
     
+    def _visible_indices(self, camera, margin: int = 1) -> List[int]:
+        """Indices (in list order) of buildings whose rect is within margin pixels of the view"""
+        min_x, min_y, max_x, max_y = camera.world_bounds()
+        # The margin (at least a pixel) keeps float camera offsets from culling a partly visible edge
+        visible = self._get_index().query_box(
+            int(min_x) - margin, int(min_y) - margin, int(max_x) + margin, int(max_y) + margin
+        )
+        visible.sort()  # Keep list order so overlapping buildings stack as before
+        return visible
+    
+    def draw(self, surface: pygame.Surface, camera):
+        """Draw every on-screen building image with a single Surface.blits call"""
+        visible = self._visible_indices(camera)
+        buildings = self.buildings
+        # camera.apply is a pure translate (Rect.move truncates the float offset), so
+        # work out the integer shift once instead of building a Rect per building
+        shift_x = int(-camera.offset.x)
+        shift_y = int(-camera.offset.y)
+        blit_sequence = []
+        for i in visible:
+            building = buildings[i]
+            rect = building.rect
+            blit_sequence.append((building.image, (rect.x + shift_x, rect.y + shift_y)))
+        surface.blits(blit_sequence, doreturn=False)
+    
     def draw_debug_info(self, surface: pygame.Surface, camera):
-        """Draw debug information for all buildings"""
-        # Draw debug info for all buildings, not just interactive ones
-        for building in self.buildings:
-            if hasattr(building, '_draw_debug_info'):
-                building._draw_debug_info(surface, camera)
-        
+        """Draw debug information for all on-screen buildings"""
+        # Draw debug info for all buildings, not just interactive ones. Labels and
+        # entry zones can stick out of the building rect, hence the wider margin.
+        buildings = self.buildings
+        for i in self._visible_indices(camera, _DEBUG_CULL_MARGIN):
+            buildings[i]._draw_debug_info(surface, camera)
     
     def get_system_info(self) -> Dict:
-        """Get comprehensive information about the building system"""
+        """Get comprehensive information about the building system (cached - do not mutate)"""
+        if self._system_info_cache and self._system_info_cache[0] == self._info_version:
+            return self._system_info_cache[1]
+        
         interaction_info = self.interaction_system.get_interaction_info()
         
-        interactive_buildings = [b for b in self.buildings if b.interactive]
-        decorative_buildings = [b for b in self.buildings if not b.interactive]
+        # Single pass over the buildings instead of one comprehension/sum per field
+        interactive_count = 0
+        total_npcs = 0
+        at_capacity = 0
+        building_types = []
+        for building in self.buildings:
+            building_types.append(building.building_type)
+            if building.interactive:
+                interactive_count += 1
+            interior_manager = building.interior_manager
+            if interior_manager is None:
+                at_capacity += 1  # Non-interior buildings are always "at capacity"
+                continue
+            npc_count = interior_manager.get_npc_count()
+            total_npcs += npc_count
+            if npc_count >= interior_manager.max_npcs:
+                at_capacity += 1
         
-        return {
+        system_info = {
             "buildings_count": len(self.buildings),
-            "interactive_buildings_count": len(interactive_buildings),
-            "decorative_buildings_count": len(decorative_buildings),
-            "building_types": [b.building_type for b in self.buildings],
+            "interactive_buildings_count": interactive_count,
+            "decorative_buildings_count": len(self.buildings) - interactive_count,
+            "building_types": building_types,
             "interaction_info": interaction_info,
-            "total_npcs_in_buildings": sum(b.get_npc_count() for b in self.buildings),
-            "buildings_at_capacity": sum(1 for b in self.buildings if b.is_at_npc_capacity())
+            "total_npcs_in_buildings": total_npcs,
+            "buildings_at_capacity": at_capacity
         }
+        self._system_info_cache = (self._info_version, system_info)
+        return system_info
     
     def cleanup(self):
         """Clean up the building system"""
@@ -490,45 +771,124 @@ class BuildingManager:
             # Clean up any building-specific resources if needed
             if hasattr(building, 'interior_manager') and building.interior_manager:
                 building.interior_manager.npcs_inside.clear()
+        self._invalidate_info()
     
     def find_building_by_type(self, building_type: str) -> Optional[Building]:
         """Find the first building of a specific type"""
-        for building in self.buildings:
-            if building.building_type == building_type:
-                return building
-        return None
+        return next(iter(self._by_type.get(building_type, ())), None)
     
     def find_buildings_by_type(self, building_type: str) -> List[Building]:
         """Find all buildings of a specific type"""
-        return [b for b in self.buildings if b.building_type == building_type]
+        return list(self._by_type.get(building_type, ()))
     
     def get_building_at_position(self, x: int, y: int) -> Optional[Building]:
         """Find building at a specific position"""
-        point = pygame.Rect(x, y, 1, 1)
-        for building in self.buildings:
-            if building.rect.colliderect(point):
-                return building
-        return None
+        x = int(x)
+        y = int(y)
+        index = self._get_index()
+        
+        if self._aabb is not None:
+            aabb = self._aabb
+            inside = (aabb[:, 0] <= x) & (x < aabb[:, 2]) & (aabb[:, 1] <= y) & (y < aabb[:, 3])
+            hit_indices = np.flatnonzero(inside)
+            return self.buildings[int(hit_indices[0])] if hit_indices.size else None
+        
+        hits = index.query_box(x, y, x + 1, y + 1)
+        # Keep list order precedence when buildings overlap
+        return self.buildings[min(hits)] if hits else None
     
     def get_nearest_building(self, x: int, y: int) -> Optional[Building]:
         """Get the nearest building to a position"""
         if not self.buildings:
             return None
         
-        min_distance = float('inf')
-        nearest_building = None
+        x = int(x)
+        y = int(y)
         
-        for building in self.buildings:
-            # Calculate distance to building center
-            dx = building.rect.centerx - x
-            dy = building.rect.centery - y
-            distance = (dx * dx + dy * dy) ** 0.5
-            
-            if distance < min_distance:
-                min_distance = distance
-                nearest_building = building
+        if len(self.buildings) < _INDEXED_MIN_BUILDINGS:
+            # Linear scan of squared distances - the first closest building wins, as with argmin
+            nearest = None
+            best_distance = -1
+            for building in self.buildings:
+                dx = building.rect.centerx - x
+                dy = building.rect.centery - y
+                distance = dx * dx + dy * dy
+                if nearest is None or distance < best_distance:
+                    nearest = building
+                    best_distance = distance
+            return nearest
+        
+        index = self._get_index()
+        if self._centers is not None:
+            # argmin of squared distance picks the same (first) building as argmin of distance
+            return self.buildings[int(_nearest_index(self._centers, x, y))]
+        
+        bounds = index.bounds
+        
+        # Grow a search square until it contains at least one building center
+        radius = self._index_search_radius
+        while True:
+            candidates = [
+                i for i in index.query_box(x - radius, y - radius, x + radius + 1, y + radius + 1)
+                if abs(self.buildings[i].rect.centerx - x) <= radius
+                and abs(self.buildings[i].rect.centery - y) <= radius
+            ]
+            if candidates or (x - radius <= bounds.left and y - radius <= bounds.top and
+                              x + radius >= bounds.right and y + radius >= bounds.bottom):
+                break
+            radius *= 2
+        
+        def squared_distance(i):
+            dx = self.buildings[i].rect.centerx - x
+            dy = self.buildings[i].rect.centery - y
+            return dx * dx + dy * dy
+        
+        if not candidates:
+            candidates = range(len(self.buildings))
+        
+        # The first hit may sit in a corner of the square, so re-query a square
+        # covering the best distance found so far before choosing
+        best_distance = min(squared_distance(i) for i in candidates)
+        radius = int(best_distance ** 0.5) + 1
+        candidates = set(candidates)
+        candidates.update(index.query_box(x - radius, y - radius, x + radius + 1, y + radius + 1))
+        
+        nearest = min(candidates, key=lambda i: (squared_distance(i), i))
+        return self.buildings[nearest]
+    
+    def get_nearest_buildings_batch(self, points) -> List[Optional[Building]]:
+        """Get the nearest building to each (x, y) point in one pass - for many NPCs per frame"""
+        if not self.buildings:
+            return [None] * len(points)
         
-        return nearest_building
+        self._get_index()
+        if self._centers is None:
+            return [self.get_nearest_building(x, y) for x, y in points]
+        
+        # int64 truncates like the int() in get_nearest_building
+        points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        buildings = self.buildings
+        return [buildings[i] for i in _nearest_indices(self._centers, points).tolist()]
+    
+    def _find_overlapping_pairs(self) -> List[Tuple[int, int]]:
+        """Index pairs (i < j) of buildings whose rects overlap, sorted by i then j"""
+        # Validation always looks at the live rects, even if a building moved without notice
+        self._index_dirty = True
+        index = self._get_index()
+        
+        if self._aabb is not None:
+            # One broadcast pass over the edge arrays instead of a Python double loop
+            lefts, tops, rights, bottoms = self._aabb.T
+            overlap = ((lefts[:, None] < rights[None, :]) & (rights[:, None] > lefts[None, :]) &
+                       (tops[:, None] < bottoms[None, :]) & (bottoms[:, None] > tops[None, :]))
+            rows, cols = np.nonzero(np.triu(overlap, k=1))
+            return list(zip(rows.tolist(), cols.tolist()))
+        
+        # The index only returns rects that actually overlap, so distant pairs are never compared
+        pairs = []
+        for i, building in enumerate(self.buildings):
+            pairs.extend((i, j) for j in sorted(index.query(building.rect)) if j > i)
+        return pairs
     
     def validate_system(self) -> Dict[str, List[str]]:
         """Validate the building system and return any issues found"""
@@ -539,16 +899,17 @@ class BuildingManager:
         }
         
         # Check for overlapping buildings
-        for i, building1 in enumerate(self.buildings):
-            for j, building2 in enumerate(self.buildings[i+1:], i+1):
-                if building1.rect.colliderect(building2.rect):
-                    issues["warnings"].append(
-                        f"Buildings {i} and {j} are overlapping: "
-                        f"{building1.building_type} at {building1.rect} and "
-                        f"{building2.building_type} at {building2.rect}"
-                    )
+        for i, j in self._find_overlapping_pairs():
+            building1 = self.buildings[i]
+            building2 = self.buildings[j]
+            issues["warnings"].append(
+                f"Buildings {i} and {j} are overlapping: "
+                f"{building1.building_type} at {building1.rect} and "
+                f"{building2.building_type} at {building2.rect}"
+            )
         
         # Check for buildings without proper configuration
+        total_capacity = 0
         for i, building in enumerate(self.buildings):
             if not hasattr(building, 'config') or not building.config:
                 issues["errors"].append(f"Building {i} ({building.building_type}) has no config")
@@ -565,15 +926,16 @@ class BuildingManager:
                 issues["warnings"].append(
                     f"Building {i} ({building.building_type}) is non-interactive but has interaction_padding"
                 )
+            elif building.interactive:
+                total_capacity += building.config["max_npcs"]
         
-        # System-wide checks
-        interactive_buildings = [b for b in self.buildings if b.interactive]
-        total_capacity = sum(b.config["max_npcs"] for b in interactive_buildings)
-        total_npcs = sum(b.get_npc_count() for b in self.buildings)
+        # System-wide checks - counts come from the cached system info instead of more scans
+        system_info = self.get_system_info()
+        total_npcs = system_info["total_npcs_in_buildings"]
         
         issues["info"].append(f"Total buildings: {len(self.buildings)}")
-        issues["info"].append(f"Interactive buildings: {len(interactive_buildings)}")
-        issues["info"].append(f"Decorative buildings: {len(self.buildings) - len(interactive_buildings)}")
+        issues["info"].append(f"Interactive buildings: {system_info['interactive_buildings_count']}")
+        issues["info"].append(f"Decorative buildings: {system_info['decorative_buildings_count']}")
         issues["info"].append(f"Total building capacity: {total_capacity}")
         issues["info"].append(f"Total NPCs in buildings: {total_npcs}")
         if total_capacity > 0:
@@ -593,11 +955,9 @@ class BuildingFactory:
         
         # Add house-specific customizations
         if variant == "large":
-            building.config["max_npcs"] = 5
-            building.config["interior_size"] = (1000, 800)
+            building.config = BuildingConfig.derive(building.config, {"max_npcs": 5, "interior_size": (1000, 800)})
         elif variant == "small":
-            building.config["max_npcs"] = 2
-            building.config["interior_size"] = (600, 400)
+            building.config = BuildingConfig.derive(building.config, {"max_npcs": 2, "interior_size": (600, 400)})
         
         return building
     
@@ -608,11 +968,10 @@ class BuildingFactory:
         
         # Add shop-specific customizations
         if shop_type == "tavern":
-            building.config["max_npcs"] = 8
-            building.config["interior_size"] = (1200, 900)
+            building.config = BuildingConfig.derive(building.config, {"max_npcs": 8, "interior_size": (1200, 900)})
         elif shop_type == "blacksmith":
-            building.config["max_npcs"] = 2
-            building.config["door_width"] = 150  # Wider door for equipment
+            # Wider door for equipment
+            building.config = BuildingConfig.derive(building.config, {"max_npcs": 2, "door_width": 150})
         
         return building
     
@@ -623,20 +982,17 @@ class BuildingFactory:
         
         # Town hall variants
         if variant == "grand":
-            building.config["max_npcs"] = 12
-            building.config["interior_size"] = (1500, 1200)
-            building.config["scale_factor"] = 1.4
+            building.config = BuildingConfig.derive(
+                building.config, {"max_npcs": 12, "interior_size": (1500, 1200), "scale_factor": 1.4}
+            )
         elif variant == "modest":
-            building.config["max_npcs"] = 5
-            building.config["interior_size"] = (1000, 700)
-            building.config["scale_factor"] = 1.0
+            building.config = BuildingConfig.derive(
+                building.config, {"max_npcs": 5, "interior_size": (1000, 700), "scale_factor": 1.0}
+            )
         
         # Re-scale the image if size changed
         if building.config["scale_factor"] != 1.2:  # Default scale from config
-            scale_factor = building.config["scale_factor"]
-            original_size = building.original_image.get_size()
-            new_size = (int(original_size[0] * scale_factor), int(original_size[1] * scale_factor))
-            building.image = pygame.transform.scale(building.original_image, new_size)
+            building.image = _get_scaled_image(building.original_image, building.config["scale_factor"])
             building.rect = building.image.get_rect(topleft=(x, y))
             building._setup_collision_areas()
         
@@ -645,33 +1001,29 @@ class BuildingFactory:
     @staticmethod
     def create_fountain(x: int, y: int, assets, size: str = "large") -> Building:
         """Create a fountain - decorative, non-interactive building"""
-        building = Building(x, y, "fountain", assets)
+        config = BuildingConfig.get_config("fountain")
         
-        # Fountain size variants
+        # Fountain size variants - decided before construction so the image is
+        # scaled and the collision areas are set up only once
         if size == "large":
-            building.config["scale_factor"] = 1.3
-            building.config["hitbox_padding"] = {"width": 53, "height": 100, "x": 26, "y": 50}
+            config = BuildingConfig.derive(config, {
+                "scale_factor": 1.3,
+                "hitbox_padding": {"width": 53, "height": 100, "x": 26, "y": 50}
+            })
         elif size == "huge":
-            building.config["scale_factor"] = 2.0
-            building.config["hitbox_padding"] = {"width": 120, "height": 150, "x": 60, "y": 75}
-        
-        # Re-scale the image and recalculate rect if size changed
-        if building.config["scale_factor"] != 1.8:  # Default scale from config
-            scale_factor = building.config["scale_factor"]
-            original_size = building.original_image.get_size()
-            new_size = (int(original_size[0] * scale_factor), int(original_size[1] * scale_factor))
-            building.image = pygame.transform.scale(building.original_image, new_size)
-            building.rect = building.image.get_rect(topleft=(x, y))
-            building._setup_collision_areas()
+            config = BuildingConfig.derive(config, {
+                "scale_factor": 2.0,
+                "hitbox_padding": {"width": 120, "height": 150, "x": 60, "y": 75}
+            })
         
-        return building
+        return Building(x, y, "fountain", assets, config)
     
     @staticmethod
     def create_custom_building(x: int, y: int, assets, config: Dict) -> Building:
         """Create a building with completely custom configuration"""
         # Use house as base type but override with custom config
         building = Building(x, y, "house", assets)
-        building.config.update(config)
+        building.config = BuildingConfig.derive(building.config, config)
         
         # Reinitialize with new config
         building.can_enter = building.config["can_enter"]
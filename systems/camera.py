@@ -68,6 +68,12 @@ class Camera:
         ## Get the rectangle representing the visible area in world coordinates
         return pygame.Rect(self.offset.x, self.offset.y, self.width, self.height)
     
+    def world_bounds(self):
+        ## Get the visible area as plain (min_x, min_y, max_x, max_y) world coordinates (no Rect allocation)
+        min_x = self.offset.x
+        min_y = self.offset.y
+        return (min_x, min_y, min_x + self.width, min_y + self.height)
+    
     def set_position(self, x, y):
         ## Manually set camera position (useful for cutscenes or specific positioning)
         self.offset.x = max(0, min(x, self.world_width - self.width))
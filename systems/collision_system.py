@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import List, Optional, Dict, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class CollisionInfo:
     """Data class for collision information"""
     overlap_x: float
@@ -19,6 +19,9 @@ class CollisionInfo:
 class CollisionMixin:
     """Mixin class providing collision detection and resolution"""
     
+    # Empty so slotted subclasses (e.g. Building) don't regain a per-instance __dict__
+    __slots__ = ()
+    
     def check_collision(self, other_rect: pygame.Rect) -> bool:
         """Check if another rectangle collides with this object's hitbox"""
         return self.hitbox.colliderect(other_rect)
@@ -68,6 +71,8 @@ class CollisionMixin:
 class InteriorWall(CollisionMixin):
     """Represents a wall inside a building with collision detection"""
     
+    __slots__ = ('rect', 'hitbox', 'is_solid', 'can_enter')
+    
     def __init__(self, x: int, y: int, width: int, height: int):
         self.rect = pygame.Rect(x, y, width, height)
         self.hitbox = self.rect  # For compatibility with collision system
@@ -125,6 +130,8 @@ class CollisionSystem:
 class InteriorFurnitureCollision(CollisionMixin):
     """Represents furniture collision inside a building"""
     
+    __slots__ = ('rect', 'hitbox', 'furniture_type', 'is_solid', 'can_enter', 'interaction_zone')
+    
     def __init__(self, furniture_rect: pygame.Rect, furniture_type: str):
         self.rect = furniture_rect
         self.hitbox = furniture_rect
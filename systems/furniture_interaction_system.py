@@ -54,19 +54,23 @@ class FurnitureInteractionSystem:
             return None
         
         closest = None
-        min_distance = float('inf')
+        min_distance_sq = float('inf')
+        player_x = player.x
+        player_y = player.y
         
         for furniture in furniture_list:
             # Calculate distance to furniture center
-            furniture_center_x = furniture.x + furniture.rect.width // 2
-            furniture_center_y = furniture.y + furniture.rect.height // 2
+            rect = furniture.rect
+            furniture_center_x = furniture.x + rect.width // 2
+            furniture_center_y = furniture.y + rect.height // 2
             
-            dx = player.x - furniture_center_x
-            dy = player.y - furniture_center_y
-            distance = (dx * dx + dy * dy) ** 0.5
+            # Squared distance picks the same closest furniture without a sqrt
+            dx = player_x - furniture_center_x
+            dy = player_y - furniture_center_y
+            distance_sq = dx * dx + dy * dy
             
-            if distance < min_distance:
-                min_distance = distance
+            if distance_sq < min_distance_sq:
+                min_distance_sq = distance_sq
                 closest = furniture
         
         return closest
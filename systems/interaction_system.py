@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional, List, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerPosition:
     """Data class for storing player position and state"""
     x: float
@@ -17,6 +17,8 @@ class PlayerPosition:
 class InteractionZone:
     """Manages interaction zones around buildings"""
     
+    __slots__ = ('building_rect', 'interaction_padding', 'interaction_zone')
+    
     def __init__(self, building_rect: pygame.Rect, interaction_padding: int):
         self.building_rect = building_rect
         self.interaction_padding = interaction_padding
@@ -24,11 +26,15 @@ class InteractionZone:
     
     def _create_interaction_zone(self) -> pygame.Rect:
         """Create interaction zone around the building"""
+        return pygame.Rect(self._zone_geometry())
+    
+    def _zone_geometry(self) -> Tuple[int, int, int, int]:
+        """(x, y, width, height) of the interaction zone around the building"""
         zone_x = self.building_rect.x - self.interaction_padding
         zone_y = self.building_rect.y - self.interaction_padding
         zone_width = self.building_rect.width + (self.interaction_padding * 2)
         zone_height = self.building_rect.height + (self.interaction_padding * 2)
-        return pygame.Rect(zone_x, zone_y, zone_width, zone_height)
+        return (zone_x, zone_y, zone_width, zone_height)
     
     def check_interaction_range(self, rect: pygame.Rect) -> bool:
         """Check if a rectangle is within interaction range"""
@@ -37,7 +43,8 @@ class InteractionZone:
     def update_position(self, new_building_rect: pygame.Rect):
         """Update interaction zone when building moves"""
         self.building_rect = new_building_rect
-        self.interaction_zone = self._create_interaction_zone()
+        # Reuse the existing Rect so moving buildings allocate nothing
+        self.interaction_zone.update(self._zone_geometry())
     
     def draw_debug(self, surface: pygame.Surface, camera):
         """Draw debug visualization of interaction zone"""
@@ -176,6 +183,9 @@ class BuildingInteractionSystem:
     def __init__(self, buildings: List):
         self.buildings = buildings
         self.transition_manager = TransitionManager()
+        # Mirror of transition_manager.current_interior, kept in sync on enter/exit so
+        # per-frame callers can read a plain attribute instead of going through accessors
+        self.current_interior = None
         self.interaction_zones = []
         self._create_interaction_zones()
     
@@ -183,11 +193,33 @@ class BuildingInteractionSystem:
         """Create interaction zones for all buildings"""
         self.interaction_zones.clear()
         for building in self.buildings:
-            if hasattr(building, 'config') and hasattr(building, 'rect'):
-                interaction_padding = building.config.get("interaction_padding", 40)
-                zone = InteractionZone(building.rect, interaction_padding)
-                building.interaction_zone = zone
-                self.interaction_zones.append(zone)
+            self._create_zone(building)
+    
+    def _create_zone(self, building):
+        """Create the interaction zone for a single building"""
+        if hasattr(building, 'config') and hasattr(building, 'rect'):
+            interaction_padding = building.config.get("interaction_padding", 40)
+            zone = InteractionZone(building.rect, interaction_padding)
+            building.interaction_zone = zone
+            self.interaction_zones.append(zone)
+    
+    def add_zone_for(self, building):
+        """Add a building and its interaction zone without rebuilding the others"""
+        if building in self.buildings:
+            return
+        self.buildings.append(building)
+        self._create_zone(building)
+    
+    def remove_zone_for(self, building) -> bool:
+        """Remove a building and its interaction zone without rebuilding the others"""
+        if building not in self.buildings:
+            return False
+        # Zones are kept in the same order as buildings (see update_building_positions)
+        index = self.buildings.index(building)
+        del self.buildings[index]
+        if index < len(self.interaction_zones):
+            del self.interaction_zones[index]
+        return True
     
     def add_transition_callback(self, callback):
         """Add a callback for transition events"""
@@ -199,7 +231,9 @@ class BuildingInteractionSystem:
     
     def enter_building(self, building, player) -> bool:
         """Enter a building interior"""
-        return self.transition_manager.enter_building(building, player)
+        entered = self.transition_manager.enter_building(building, player)
+        self.current_interior = self.transition_manager.current_interior
+        return entered
     
     def check_building_exit(self, player_rect: pygame.Rect) -> bool:
         """Check if player can exit current building"""
@@ -207,7 +241,9 @@ class BuildingInteractionSystem:
     
     def exit_building(self, player) -> bool:
         """Exit current building"""
-        return self.transition_manager.exit_building(player)
+        exited = self.transition_manager.exit_building(player)
+        self.current_interior = self.transition_manager.current_interior
+        return exited
     
     def is_inside_building(self) -> bool:
         """Check if player is currently inside a building"""
@@ -215,7 +251,7 @@ class BuildingInteractionSystem:
     
     def get_current_interior(self):
         """Get the current interior building"""
-        return self.transition_manager.get_current_interior()
+        return self.current_interior
     
     def update_building_positions(self):
         """Update interaction zones when buildings move (if needed)"""
@@ -240,4 +276,5 @@ class BuildingInteractionSystem:
     def cleanup(self):
         """Clean up the interaction system"""
         self.transition_manager.reset()
+        self.current_interior = None
         self.interaction_zones.clear()
\ No newline at end of file
@@ -1,13 +1,466 @@
 import pygame
 import math
 import time
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Callable
 import textwrap
+from config.settings import UI_GLOW_QUALITY
 
+# NumPy is optional - when it is installed glow layers are built from one
+# vectorised pass over the text alpha, otherwise the text is stamped per offset
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-class OverlaySystem:
+def _disk_glow_alpha(alpha, radius: int):
+    """
+    Coverage of the text alpha mask ((w, h) uint8) stamped at every offset
+    inside a disk of radius, as a (w + 2r, h + 2r) uint8 array.
+
+    Stamping multiplies the transmittance (1 - a) of every covered pixel, so
+    the log transmittance is summed over the disk instead - one horizontal
+    prefix-sum window per disk row rather than one blit per offset.
+    """
+    width, height = alpha.shape
+    size = radius * 2
+    log_clear = np.log(np.maximum(1.0 - alpha / 255.0, 1e-6))
+    
+    # Prefix sums along x, padded so every window slice stays in range
+    prefix = np.zeros((width + size * 2 + 1, height))
+    np.cumsum(log_clear, axis=0, out=prefix[size + 1:size + 1 + width])
+    prefix[size + 1 + width:] = prefix[size + width]
+    
+    total = np.zeros((width + size, height + size))
+    for dy in range(-radius, radius + 1):
+        span = int(math.isqrt(radius * radius - dy * dy))
+        # Window [x - span, x + span] of the text shifted by radius, for every output x
+        upper = prefix[radius + span + 1:radius + span + 1 + width + size]
+        lower = prefix[radius - span:radius - span + width + size]
+        total[:, radius + dy:radius + dy + height] += upper - lower
+    return np.rint(255.0 - np.exp(total) * 255.0).astype(np.uint8)
+
+
+def _background_dot_colors(diagonals, current_time: float):
+    """
+    Animated background dot color for each grid diagonal (x + y of its cells)
+    as an (n, 3) uint8 array - the dark base color where the wave is dim.
+    """
+    wave_offset = np.sin(diagonals * 0.02 + current_time * 2) * 0.5 + 0.5
+    hue = (diagonals * 0.01 + current_time * 0.5) % 6.0
+    low = 20 + wave_offset * 15
+    mid = 50 + wave_offset * 30
+    high = 80 + wave_offset * 40
+    
+    bands = [hue < 2, hue < 4]
+    colors = np.stack((np.select(bands, [mid, low], high),
+                       np.select(bands, [low, mid], low),
+                       np.select(bands, [high, high], mid)), axis=1).astype(np.uint8)
+    colors[wave_offset <= 0.7] = (20, 20, 30)
+    return colors
+
+
+def _draw_background_dots(pixels, cell_diagonals, origin: int, grid_size: int, current_time: float):
+    """
+    Write the 2x2 animated background dots into pixels ((w, h, 3) uint8 view)
+    for the grid cells whose diagonal numbers are cell_diagonals ((columns, rows)).
+    origin is x + y of the top-left cell.
+    """
+    columns, rows = cell_diagonals.shape
+    diagonals = origin + grid_size * np.arange(columns + rows - 1)
+    cells = _background_dot_colors(diagonals, current_time)[cell_diagonals]
+    
+    # Every dot is 2x2, so write the cell grid at the four pixel phases
+    for dx in (0, 1):
+        for dy in (0, 1):
+            dots = pixels[dx::grid_size, dy::grid_size]
+            dots[...] = cells[:dots.shape[0], :dots.shape[1]]
+
+
+def _build_rgb_lut() -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Neon color cycle sampled at every color step - 255 entries per hue sextant.
+    Each channel is the branch-free sextant ramp clamp(2 - |h - k|) (red as
+    clamp(|h - 3| - 1)), sampled mid-step so rising channels come out at j and
+    falling channels at 254 - j, matching the int() truncation of the ramps
+    """
+    def ramp(x: float) -> int:
+        return int(min(1.0, max(0.0, x)) * 255)
+    
+    lut = []
+    for step in range(6 * 255):
+        h = (step + 0.5) / 255
+        lut.append((ramp(abs(h - 3) - 1), ramp(2 - abs(h - 2)), ramp(2 - abs(h - 4))))
+    return tuple(lut)
+
+
+# get_rgb_color tables indexed by int(hue * 255) - OverlaySystem cycles the full
+# six sextants, ModalOverlay's hue stays below 0.6 so only its first ramp is used
+_RGB_LUT = _build_rgb_lut()
+_DARK_RGB_LUT = tuple((int(255 * 0.6), int(up * 0.6), 0) for up in range(int(255 * 0.6)))
+
+
+# Translucent dimming layers per (size, alpha, color), filled once and reused
+_DIM_SURFACES: Dict[Tuple[Tuple[int, int], int, Tuple[int, int, int]], pygame.Surface] = {}
+
+
+def _get_dim_surface(size: Tuple[int, int], alpha: int, color: Tuple[int, int, int] = (0, 0, 0)) -> pygame.Surface:
+    """Get a translucent fill layer, creating it only for a new size/alpha/color"""
+    key = (size, alpha, color)
+    surface = _DIM_SURFACES.get(key)
+    if surface is None:
+        # Display format keeps the per-frame alpha blit on the fast path
+        surface = _convert_for_display(pygame.Surface(size), per_pixel_alpha=False)
+        surface.set_alpha(alpha)
+        surface.fill(color)
+        _DIM_SURFACES[key] = surface
+    return surface
+
+
+# Keybind list chrome (backdrop, scrollbar track) and scroll shadows, built per size
+# instead of allocated or redrawn primitive by primitive every frame
+_BACKDROP_SURFACES: Dict[Tuple[int, int], pygame.Surface] = {}
+_SCROLLBAR_TRACKS: Dict[Tuple[Tuple[int, int], Tuple[int, int, int]], pygame.Surface] = {}
+_SHADOW_SURFACES: Dict[Tuple[int, int, bool], pygame.Surface] = {}
+
+
+def _get_backdrop_surface(size: Tuple[int, int]) -> pygame.Surface:
+    """Translucent rounded backdrop behind the keybind list, with its opaque outline baked in"""
+    surface = _BACKDROP_SURFACES.get(size)
+    if surface is None:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill((20, 20, 30, 200))
+        pygame.draw.rect(surface, (255, 255, 255, 30), surface.get_rect(), border_radius=10)  # Dimmed border
+        # Opaque pixels blit unchanged, so the outline can live in the same surface
+        pygame.draw.rect(surface, (120, 120, 160), surface.get_rect(), 2, border_radius=10)  # Dimmed border
+        surface = _BACKDROP_SURFACES[size] = _convert_for_display(surface)
+    return surface
+
+
+def _get_scrollbar_track(size: Tuple[int, int], border_color: Tuple[int, int, int]) -> pygame.Surface:
+    """Rounded scrollbar track with its border, transparent outside the rounded corners"""
+    key = (size, border_color)
+    surface = _SCROLLBAR_TRACKS.get(key)
+    if surface is None:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, (60, 60, 60), surface.get_rect(), border_radius=10)
+        pygame.draw.rect(surface, border_color, surface.get_rect(), 2, border_radius=10)
+        surface = _SCROLLBAR_TRACKS[key] = _convert_for_display(surface)
+    return surface
+
+
+def _get_shadow_surface(width: int, height: int, fade_in: bool) -> pygame.Surface:
+    """Black scroll shadow, alpha 120 fading to 0 downwards (or 0 up to 120 when fade_in)"""
+    key = (width, height, fade_in)
+    surface = _SHADOW_SURFACES.get(key)
+    if surface is None:
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i in range(height):
+            fade = i / height if fade_in else 1 - i / height
+            surface.fill((0, 0, 0, int(120 * fade)), (0, i, width, 1))
+        surface = _SHADOW_SURFACES[key] = _convert_for_display(surface)
+    return surface
+
+
+# Close button faces per (size, fill color, line color), drawn once and reused
+_CLOSE_BUTTON_FACES: Dict[Tuple[Tuple[int, int], Tuple[int, int, int], Tuple[int, int, int]], pygame.Surface] = {}
+
+
+def _get_close_button_face(size: Tuple[int, int], fill_color: Tuple[int, int, int],
+                           line_color: Tuple[int, int, int]) -> pygame.Surface:
+    """Get the close button fill, border and X, drawing them only once per size and colors"""
+    key = (size, fill_color, line_color)
+    face = _CLOSE_BUTTON_FACES.get(key)
+    if face is None:
+        face = _CLOSE_BUTTON_FACES[key] = _convert_for_display(pygame.Surface(size), per_pixel_alpha=False)
+        face_rect = face.get_rect()
+        pygame.draw.rect(face, fill_color, face_rect)
+        pygame.draw.rect(face, line_color, face_rect, 2)
+        
+        # Draw X in close button
+        x_size = 8
+        x_center = face_rect.center
+        pygame.draw.line(face, line_color, 
+                        (x_center[0] - x_size, x_center[1] - x_size),
+                        (x_center[0] + x_size, x_center[1] + x_size), 2)
+        pygame.draw.line(face, line_color,
+                        (x_center[0] + x_size, x_center[1] - x_size),
+                        (x_center[0] - x_size, x_center[1] + x_size), 2)
+    return face
+
+
+def _convert_for_display(surface: pygame.Surface, per_pixel_alpha: bool = True) -> pygame.Surface:
+    """Copy of surface in the display's pixel format (with per-pixel alpha by default), once a display mode is set"""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if per_pixel_alpha else surface.convert()
+
+
+def _blit_all(target: pygame.Surface, stamps: List[Tuple[pygame.Surface, Tuple[int, int]]],
+              special_flags: int = 0):
+    """Blit (surface, dest) pairs in one call - fblits on pygame-ce, blits otherwise"""
+    if hasattr(target, "fblits"):
+        target.fblits(stamps, special_flags)
+    else:
+        target.blits([(surface, dest, None, special_flags) for surface, dest in stamps], doreturn=False)
+
+
+# Glow outline layers per (rect size, glow_size) as [inset, layer, edge strips, painted RGBA]
+# lists - only the outline pixels are repainted when the color or pulse changes, so the
+# panel-sized layers are allocated once instead of every frame
+_GLOW_OUTLINES: Dict[Tuple[Tuple[int, int], int], List[List[Any]]] = {}
+
+
+def _get_glow_outline(size: Tuple[int, int], glow_size: int) -> List[List[Any]]:
+    """Transparent outline layers for a glow_size glow around a rect of size, built once"""
+    key = (size, glow_size)
+    layers = _GLOW_OUTLINES.get(key)
+    if layers is None:
+        layers = _GLOW_OUTLINES[key] = []
+        for i in range(glow_size, 0, -1):
+            layer = _convert_for_display(pygame.Surface((size[0] + i * 2, size[1] + i * 2), pygame.SRCALPHA))
+            width, height = layer.get_size()
+            thickness = max(1, i // 2)
+            # The interior stays transparent, so only the four edges (views sharing the
+            # layer's pixels) need blitting
+            edges = [(0, 0, width, thickness), (0, height - thickness, width, thickness),
+                     (0, thickness, thickness, height - thickness * 2),
+                     (width - thickness, thickness, thickness, height - thickness * 2)]
+            strips = [(layer.subsurface(edge), edge[:2]) for edge in edges if edge[2] > 0 and edge[3] > 0]
+            layers.append([i, layer, strips, None])
+    return layers
+
+
+# Particle columns per (count, x_step, y_step, width, height) as a struct of arrays -
+# positions are fixed for a screen size, only the time-driven part varies per frame
+_PARTICLE_LAYOUTS: Dict[Tuple[int, int, int, int, int], Tuple[Any, Any, Any]] = {}
+
+
+def _particle_layout(count: int, x_step: int, y_step: int, width: int, height: int) -> Tuple[Any, Any, Any]:
+    """(xs, ys, index) for count particles spread over the screen by fixed prime steps"""
+    key = (count, x_step, y_step, width, height)
+    layout = _PARTICLE_LAYOUTS.get(key)
+    if layout is None:
+        xs = [(i * x_step) % width for i in range(count)]
+        ys = [(i * y_step) % height for i in range(count)]
+        if np is not None:
+            layout = (np.array(xs), np.array(ys), np.arange(count, dtype=np.float64))
+        else:
+            layout = (xs, ys, list(range(count)))
+        _PARTICLE_LAYOUTS[key] = layout
+    return layout
+
+
+def _twinkling_stars(count: int, width: int, height: int, current_time: float) -> List[Tuple[int, int, float]]:
+    """(x, y, twinkle) of the stars bright enough to draw this frame"""
+    xs, ys, index = _particle_layout(count, 137, 211, width, height)
+    if np is not None:
+        twinkle = np.sin(current_time * 2 + index) * 0.5 + 0.5
+        visible = np.flatnonzero(twinkle > 0.6)
+        return list(zip(xs[visible].tolist(), ys[visible].tolist(), twinkle[visible].tolist()))
+    
+    stars = []
+    for x, y, i in zip(xs, ys, index):
+        twinkle = math.sin(current_time * 2 + i) * 0.5 + 0.5
+        if twinkle > 0.6:
+            stars.append((x, y, twinkle))
+    return stars
+
+
+def _falling_pixels(count: int, x_step: int, y_step: int, speed: float, trail: int, peak: int,
+                    min_alpha: int, width: int, height: int, current_time: float) -> List[Tuple[int, int, int]]:
+    """(x, y, alpha) of the matrix-rain pixels above min_alpha - each falls at speed and fades over trail pixels"""
+    xs, _, index = _particle_layout(count, x_step, 0, width, height)
+    span = height + trail
+    if np is not None:
+        ys = ((current_time * speed + index * y_step) % span).astype(np.int64)
+        alphas = np.maximum(0, peak - ys % trail)
+        visible = np.flatnonzero(alphas > min_alpha)
+        return list(zip(xs[visible].tolist(), ys[visible].tolist(), alphas[visible].tolist()))
+    
+    pixels = []
+    for x, i in zip(xs, index):
+        y = int((current_time * speed + i * y_step) % span)
+        alpha = max(0, peak - (y % trail))
+        if alpha > min_alpha:
+            pixels.append((x, y, alpha))
+    return pixels
+
+
+# Rendered label surfaces per (font, text, color) - overlay labels repeat every frame
+_TEXT_SURFACES: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+
+# Word-wrapped lines per (font, text, max_width)
+_WRAPPED_LINES: Dict[Tuple[pygame.font.Font, str, int], Tuple[str, ...]] = {}
+
+
+def _wrap_text(text: str, font: pygame.font.Font, max_width: int) -> Tuple[str, ...]:
+    """Split text into lines no wider than max_width pixels, breaking between words"""
+    key = (font, text, max_width)
+    lines = _WRAPPED_LINES.get(key)
+    if lines is None:
+        words = text.split()
+        if not words or font.size(text)[0] <= max_width:
+            lines = (text,)
+        else:
+            wrapped = []
+            start = 0
+            while start < len(words):
+                # Binary search the most words that fit (always at least one per line)
+                low, high = start + 1, len(words)
+                while low < high:
+                    middle = (low + high + 1) // 2
+                    if font.size(" ".join(words[start:middle]))[0] <= max_width:
+                        low = middle
+                    else:
+                        high = middle - 1
+                wrapped.append(" ".join(words[start:low]))
+                start = low
+            lines = tuple(wrapped)
+        _WRAPPED_LINES[key] = lines
+    return lines
+
+
+# Font.size() results per (font, text) for the constant labels used to center text
+_TEXT_SIZES: Dict[Tuple[pygame.font.Font, str], Tuple[int, int]] = {}
+
+# White text and glow halo per (font, text, glow_size) - labels are static, so the
+# disk-stamped halo is built once and only tinted to the current color per draw.
+# Keyed by the font itself so an entry can never outlive (and alias) its font.
+_GLOW_HALOS: Dict[Tuple[pygame.font.Font, str, int], Tuple[pygame.Surface, Optional[pygame.Surface]]] = {}
+
+
+class _OverlayEffects:
+    """Animation clock, glow drawing and cached text shared by OverlaySystem and ModalOverlay"""
+    
+    def __init__(self, screen: pygame.Surface):
+        self.screen = screen
+        
+        # Animation timing - _frame_t is sampled once per draw by begin_frame
+        self.start_time = time.perf_counter()
+        self._frame_t = 0.0
+        
+        # Glow layer counts are scaled by this (lower it on low-end machines)
+        self.quality_scale = UI_GLOW_QUALITY
+    
+    def begin_frame(self):
+        """Sample the animation clock once for everything drawn this frame"""
+        self._frame_t = time.perf_counter() - self.start_time
+    
+    def get_pulse_intensity(self, speed: float = 2.0, min_intensity: float = 0.3) -> float:
+        """Get pulsing intensity value"""
+        current_time = self._frame_t
+        pulse = (math.sin(current_time * speed) + 1) / 2  # 0 to 1
+        return min_intensity + pulse * (1 - min_intensity)
+    
+    def _draw_glow_outline(self, rect: pygame.Rect, glow_size: int, color: Tuple[int, int, int],
+                           pulse: float, max_alpha: int):
+        """Draw glow_size outline layers around rect, fading in towards it up to max_alpha * pulse"""
+        glow_size = int(glow_size * self.quality_scale)
+        
+        # Nothing to build when the whole glow falls outside the clip area
+        if not self.screen.get_clip().colliderect(rect.inflate(glow_size * 2, glow_size * 2)):
+            return
+        
+        # Draw multiple layers for glow effect, collected and blitted in one batch
+        stamps = []
+        for layer_state in _get_glow_outline(rect.size, glow_size):
+            i, glow_surface, strips, painted = layer_state
+            alpha = int(max_alpha * pulse * (glow_size - i + 1) / glow_size)
+            if alpha == 0:
+                continue  # Fully transparent layer
+            glow_color = (*color, alpha)
+            
+            # Repaint the cached layer's outline pixels only when color or pulse moved
+            if glow_color != painted:
+                pygame.draw.rect(glow_surface, glow_color, glow_surface.get_rect(), max(1, i // 2))
+                layer_state[3] = glow_color
+            
+            # Queue glow
+            stamps.extend((strip, (rect.x - i + x, rect.y - i + y)) for strip, (x, y) in strips)
+        
+        _blit_all(self.screen, stamps, pygame.BLEND_ALPHA_SDL2)
+    
+    def _draw_close_button(self, close_rect: pygame.Rect, mouse_pos: Optional[Tuple[int, int]], *glow_args):
+        """Draw the close button face, glowing via draw_glowing_rect(close_rect, *glow_args) while hovered"""
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        close_hover = close_rect.collidepoint(mouse_pos)
+        
+        if close_hover:
+            self.draw_glowing_rect(close_rect, *glow_args)
+        
+        # Button fill, border and X come pre-rendered in one surface
+        button_color = self.button_hover_color if close_hover else self.button_color
+        self.screen.blit(_get_close_button_face(close_rect.size, button_color, self.text_color), close_rect)
+    
+    def _text_size(self, font: pygame.font.Font, text: str) -> Tuple[int, int]:
+        """Rendered size of text in font, measured once per (font, text)"""
+        key = (font, text)
+        size = _TEXT_SIZES.get(key)
+        if size is None:
+            size = _TEXT_SIZES[key] = font.size(text)
+        return size
+    
+    def _render(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Antialiased text surface, rendered once per (font, text, color)"""
+        key = (font, text, color)
+        surface = _TEXT_SURFACES.get(key)
+        if surface is None:
+            surface = _TEXT_SURFACES[key] = _convert_for_display(font.render(text, True, color))
+        return surface
+    
+    def _get_glow_halo(self, text: str, font: pygame.font.Font,
+                       glow_size: int) -> Tuple[pygame.Surface, Optional[pygame.Surface]]:
+        """White text and its premultiplied white glow halo (None without glow), built once per (font, text, glow_size)"""
+        key = (font, text, glow_size)
+        cached = _GLOW_HALOS.get(key)
+        if cached is None:
+            # font.render pads each row, which premul_alpha ignores (pygame 2.6) - copy the
+            # pixels into a tightly packed surface before anything premultiplies them
+            rendered = font.render(text, True, (255, 255, 255))
+            text_surface = pygame.Surface(rendered.get_size(), pygame.SRCALPHA)
+            text_surface.blit(rendered, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            text_alpha = pygame.surfarray.array_alpha(text_surface) if np is not None else None
+            halo = None
+            if glow_size > 0:
+                halo = pygame.Surface((text_surface.get_width() + glow_size * 2,
+                                       text_surface.get_height() + glow_size * 2), pygame.SRCALPHA)
+            for i in range(glow_size, 0, -1):
+                glow_surface = pygame.Surface((text_surface.get_width() + i * 2, 
+                                             text_surface.get_height() + i * 2), pygame.SRCALPHA)
+                
+                if text_alpha is not None:
+                    # White stamps over clear black leave grey == alpha, so one array fills both
+                    coverage = _disk_glow_alpha(text_alpha, i)
+                    pygame.surfarray.pixels3d(glow_surface)[...] = coverage[:, :, None]
+                    pygame.surfarray.pixels_alpha(glow_surface)[...] = coverage
+                else:
+                    # Stamp the text at every offset inside a disk of radius i
+                    for dx in range(-i, i + 1):
+                        for dy in range(-i, i + 1):
+                            if dx * dx + dy * dy <= i * i:  # Circular glow
+                                glow_surface.blit(text_surface, (i + dx, i + dy), special_flags=pygame.BLEND_ALPHA_SDL2)
+                
+                # Premultiplying the (grey == alpha) layer keeps the look of blitting it straight,
+                # and premultiplied layers merge into one halo with the same result on screen
+                halo.blit(glow_surface.premul_alpha(), (glow_size - i, glow_size - i),
+                          special_flags=pygame.BLEND_PREMULTIPLIED)
+            
+            # Cached surfaces are blitted every frame, so match the display format once
+            text_surface = _convert_for_display(text_surface)
+            if halo is not None:
+                halo = _convert_for_display(halo)
+            cached = _GLOW_HALOS[key] = (text_surface, halo)
+        return cached
+
+
+class OverlaySystem(_OverlayEffects):
     """Manages overlay screens with fancy glowing effects"""
     
+    # Centered panel (width, height) per overlay type
+    PANEL_SIZES = {"version": (850, 650), "credits": (700, 600)}
+    CLOSE_BUTTON_SIZE = 30
+    
     def __init__(self, screen: pygame.Surface, font_large: pygame.font.Font, 
                  font_small: pygame.font.Font, font_chat: pygame.font.Font):
         """
@@ -19,19 +472,28 @@ class OverlaySystem:
             font_small: Small font for body text
             font_chat: Chat font for details
         """
-        self.screen = screen
+        super().__init__(screen)
         self.font_large = font_large
         self.font_small = font_small
         self.font_chat = font_chat
         
-        # Animation timing
-        self.start_time = time.time()
-        
         # Base colors
         self.bg_color = (0, 0, 0, 180)
         self.text_color = (170, 170, 170)
         self.button_color = (60, 60, 60)
         self.button_hover_color = (80, 80, 80)
+        
+        # Animated background surface and cell diagonal grid per panel size (NumPy path)
+        self._bg_surfaces: Dict[Tuple[int, int], Tuple[pygame.Surface, Any]] = {}
+        
+        # Fixed-color glowing labels per overlay, laid out once into a flat render plan
+        # (version_info and credits_info are fixed after __init__) and composited once:
+        # name -> (quality scale, layer, offset)
+        self._static_plans: Dict[str, Tuple[Tuple[Any, ...], ...]] = {}
+        self._static_layers: Dict[str, Tuple[float, Optional[pygame.Surface], Tuple[int, int]]] = {}
+        
+        # Corner version badge (dim backdrop + glowing text) composited once: (key, layer)
+        self._corner_layer: Optional[Tuple[Tuple[Any, ...], pygame.Surface]] = None
 
         # Developer mode state
         self.developer_mode = False
@@ -96,22 +558,10 @@ class OverlaySystem:
     
     def get_rgb_color(self, speed: float = 1.0, brightness: float = 1.0) -> Tuple[int, int, int]:
         """Generate cycling RGB color for neon effects"""
-        current_time = time.time() - self.start_time
-        hue = (current_time * speed) % 6.0
-        
-        # Create smooth RGB transitions
-        if hue < 1:
-            r, g, b = 255, int(255 * hue), 0
-        elif hue < 2:
-            r, g, b = int(255 * (2 - hue)), 255, 0
-        elif hue < 3:
-            r, g, b = 0, 255, int(255 * (hue - 2))
-        elif hue < 4:
-            r, g, b = 0, int(255 * (4 - hue)), 255
-        elif hue < 5:
-            r, g, b = int(255 * (hue - 4)), 0, 255
-        else:
-            r, g, b = 255, 0, int(255 * (6 - hue))
+        hue = (self._frame_t * speed) % 6.0
+        
+        # Create smooth RGB transitions - one table lookup instead of a branch per sextant
+        r, g, b = _RGB_LUT[int(hue * 255) % len(_RGB_LUT)]
         
         # Apply brightness
         r = int(r * brightness)
@@ -120,15 +570,9 @@ class OverlaySystem:
         
         return (r, g, b)
     
-    def get_pulse_intensity(self, speed: float = 2.0, min_intensity: float = 0.3) -> float:
-        """Get pulsing intensity value"""
-        current_time = time.time() - self.start_time
-        pulse = (math.sin(current_time * speed) + 1) / 2  # 0 to 1
-        return min_intensity + pulse * (1 - min_intensity)
-
     def draw_floral_corner(self, rect: pygame.Rect, corner: str = "top_left", size: int = 30):
         """Draw subtle decorative pattern in corner"""
-        current_time = time.time() - self.start_time
+        current_time = self._frame_t
         
         # Calculate corner position with more padding
         padding = size // 3
@@ -141,33 +585,35 @@ class OverlaySystem:
         else:  # bottom_right
             cx, cy = rect.x + rect.width - padding, rect.y + rect.height - padding
         
+        # Pulse and colors are the same for every dot this frame
+        pulse = self.get_pulse_intensity(1.5, 0.4)  # Gentler pulse
+        dot_color = self.get_rgb_color(0.8, pulse * 0.3)  # Much dimmer
+        highlight_color = tuple(min(255, int(c + 40)) for c in dot_color)
+        
         # Very subtle animated dots instead of flowers
         for i in range(3):  # Reduced from 6 to 3
-            angle = (i * 120) + (current_time * 15) % 360  # Slower rotation
-            dot_x = cx + math.cos(math.radians(angle)) * (size // 6)  # Smaller radius
-            dot_y = cy + math.sin(math.radians(angle)) * (size // 6)
-            
-            pulse = self.get_pulse_intensity(1.5, 0.4)  # Gentler pulse
-            dot_color = self.get_rgb_color(0.8, pulse * 0.3)  # Much dimmer
+            angle = math.radians((i * 120) + (current_time * 15) % 360)  # Slower rotation
+            dot_x = cx + math.cos(angle) * (size // 6)  # Smaller radius
+            dot_y = cy + math.sin(angle) * (size // 6)
             
             # Smaller, more subtle dots
             pygame.draw.circle(self.screen, dot_color, (int(dot_x), int(dot_y)), 2)
             # Tiny highlight
-            highlight_color = tuple(min(255, int(c + 40)) for c in dot_color)
             pygame.draw.circle(self.screen, highlight_color, (int(dot_x), int(dot_y)), 1)
 
     def draw_decorative_border(self, rect: pygame.Rect, thickness: int = 3):
         """Draw decorative border with flowing patterns"""
-        current_time = time.time() - self.start_time
+        current_time = self._frame_t
         
         # Draw flowing pattern along edges
         pattern_spacing = 15
         wave_amplitude = 3
+        phase = current_time * 2
+        color = self.get_rgb_color(0.5, 0.7)
         
         # Top and bottom edges
         for x in range(rect.x, rect.x + rect.width, pattern_spacing):
-            wave_offset = math.sin((x * 0.02) + (current_time * 2)) * wave_amplitude
-            color = self.get_rgb_color(0.5, 0.7)
+            wave_offset = math.sin((x * 0.02) + phase) * wave_amplitude
             
             # Top edge pattern
             pygame.draw.circle(self.screen, color, 
@@ -179,8 +625,7 @@ class OverlaySystem:
         
         # Left and right edges
         for y in range(rect.y, rect.y + rect.height, pattern_spacing):
-            wave_offset = math.sin((y * 0.02) + (current_time * 2)) * wave_amplitude
-            color = self.get_rgb_color(0.5, 0.7)
+            wave_offset = math.sin((y * 0.02) + phase) * wave_amplitude
             
             # Left edge pattern
             pygame.draw.circle(self.screen, color, 
@@ -299,283 +744,304 @@ class OverlaySystem:
         """Draw a rectangle with glowing border effect"""
         if color is None:
             color = self.get_rgb_color(1.5)
-        
-        pulse = self.get_pulse_intensity(3.0, 0.4)
-        
-        # Draw multiple layers for glow effect
-        for i in range(glow_size, 0, -1):
-            alpha = int(30 * pulse * (glow_size - i + 1) / glow_size)
-            glow_color = (*color, alpha)
-            
-            # Create glow surface
-            glow_surface = pygame.Surface((rect.width + i * 2, rect.height + i * 2), pygame.SRCALPHA)
-            glow_rect = pygame.Rect(0, 0, rect.width + i * 2, rect.height + i * 2)
-            pygame.draw.rect(glow_surface, glow_color, glow_rect, max(1, i // 2))
-            
-            # Blit glow
-            glow_x = rect.x - i
-            glow_y = rect.y - i
-            self.screen.blit(glow_surface, (glow_x, glow_y), special_flags=pygame.BLEND_ALPHA_SDL2)
+        self._draw_glow_outline(rect, glow_size, color, self.get_pulse_intensity(3.0, 0.4), 30)
     
     def draw_glowing_text(self, text: str, font: pygame.font.Font, pos: Tuple[int, int], 
                          color: Optional[Tuple[int, int, int]] = None, glow_size: int = 3) -> pygame.Surface:
         """Draw text with glowing effect"""
-        if color is None:
-            color = self.get_rgb_color(2.0, 0.75)
+        glow_size = int(glow_size * self.quality_scale)
+        text_surface, halo = self._get_glow_halo(text, font, glow_size)
+        
+        # Skip the tint and blits when the text and its glow fall outside the clip area
+        glow_box = pygame.Rect(pos[0] - glow_size, pos[1] - glow_size,
+                               text_surface.get_width() + glow_size * 2,
+                               text_surface.get_height() + glow_size * 2)
+        if not self.screen.get_clip().colliderect(glow_box):
+            return text_surface
+        
+        if halo is not None:
+            if color is None:
+                color = self.get_rgb_color(2.0, 0.75)
+            
+            # Tint the cached white halo instead of re-rendering the text per disk offset.
+            # font.render ignores the alpha of an RGBA color, so the glow never depended on the pulse.
+            glow_surface = halo.copy()
+            glow_surface.fill(color, special_flags=pygame.BLEND_RGB_MULT)
+            
+            # Glow and main text in one call
+            self.screen.blits(((glow_surface, glow_box, None, pygame.BLEND_PREMULTIPLIED),
+                               (text_surface, pos)), doreturn=False)
+            return text_surface
+        
+        # Draw main text
+        self.screen.blit(text_surface, pos)
+        return text_surface
+    
+    def _version_static_items(self) -> Tuple[Tuple[Any, ...], ...]:
+        """Fixed-color labels of the version overlay as (text, font, offset, color, glow_size), relative to the panel"""
+        items = []
+        content_width = self.PANEL_SIZES["version"][0]
+        current_y = 20 + self._text_size(self.font_large, self.version_info["title"])[1] + 10
+        
+        # Version with cyan glow
+        version_x = (content_width - self._text_size(self.font_small, self.version_info["version"])[0]) // 2
+        items.append((self.version_info["version"], self.font_small, (version_x, current_y), (0, 160, 160), 3))
+        current_y += self.font_small.get_height() + 20
+        
+        # System info with subtle glow
+        info_items = [
+            f"Build Date: {self.version_info['build_date']}",
+            f"Engine: {self.version_info['engine']}",
+            f"Python: {self.version_info['python_version']}"
+        ]
         
-        pulse = self.get_pulse_intensity(2.5, 0.5)
+        chat_height = self.font_chat.get_height()
+        for item in info_items:
+            items.append((item, self.font_chat, (40, current_y), (60, 120, 160), 2))
+            current_y += chat_height + 8
         
-        # Render main text
-        text_surface = font.render(text, True, (255, 255, 255))
+        current_y += 20
         
-        # Create glow layers
-        for i in range(glow_size, 0, -1):
-            alpha = int(80 * pulse * (glow_size - i + 1) / glow_size)
-            glow_color = (*color, alpha)
+        # Features section with alternating colors
+        items.append(("KEY FEATURES:", self.font_small, (40, current_y), (220, 220, 0), 3))
+        current_y += self.font_small.get_height() + 10
+        
+        colors = [(180, 80, 180), (80, 180, 80), (180, 110, 80), (80, 180, 180)]
+        for i, feature in enumerate(self.version_info["features"]):
+            # Alternate between different glow colors
+            color = colors[i % len(colors)]
+            for line, x in self._bullet_lines(feature, self.font_chat, 60, content_width - 40):
+                items.append((line, self.font_chat, (x, current_y), color, 2))
+                current_y += chat_height + 6
+        
+        return tuple(items)
+    
+    def _credits_static_items(self) -> Tuple[Tuple[Any, ...], ...]:
+        """Fixed-color labels of the credits overlay as (text, font, offset, color, glow_size), relative to the panel"""
+        items = []
+        content_width = self.PANEL_SIZES["credits"][0]
+        current_y = 20 + self.font_large.get_height() + 20
+        
+        # Credits sections with themed colors
+        section_colors = [(255, 100, 100), (100, 255, 100), (100, 100, 255)]
+        
+        chat_height = self.font_chat.get_height()
+        for section_idx, section in enumerate(self.credits_info["sections"]):
+            section_color = section_colors[section_idx % len(section_colors)]
             
-            # Create glow surface
-            glow_surface = pygame.Surface((text_surface.get_width() + i * 2, 
-                                         text_surface.get_height() + i * 2), pygame.SRCALPHA)
+            # Section category with glow
+            items.append((section["category"], self.font_small, (40, current_y), section_color, 4))
+            current_y += self.font_small.get_height() + 8
             
-            # Draw glow text multiple times with slight offsets
-            for dx in range(-i, i + 1):
-                for dy in range(-i, i + 1):
-                    if dx * dx + dy * dy <= i * i:  # Circular glow
-                        glow_text = font.render(text, True, glow_color)
-                        glow_surface.blit(glow_text, (i + dx, i + dy), special_flags=pygame.BLEND_ALPHA_SDL2)
+            # Section entries with subtle glow
+            entry_color = tuple(int(c * 0.7) for c in section_color)  # Dimmer version
+            for entry in section["entries"]:
+                for line, x in self._bullet_lines(entry, self.font_chat, 60, content_width - 40):
+                    items.append((line, self.font_chat, (x, current_y), entry_color, 2))
+                    current_y += chat_height + 4
             
-            # Blit glow to screen
-            self.screen.blit(glow_surface, (pos[0] - i, pos[1] - i), special_flags=pygame.BLEND_ALPHA_SDL2)
+            current_y += 15  # Space between sections
         
-        # Draw main text
-        self.screen.blit(text_surface, pos)
-        return text_surface
+        return tuple(items)
+    
+    def _bullet_lines(self, text: str, font: pygame.font.Font, x: int, right: int) -> List[Tuple[str, int]]:
+        """(line, x) pairs for a bullet point wrapped to end before right, continuation lines indented past the bullet"""
+        bullet = "• "
+        indent = self._text_size(font, bullet)[0]
+        lines = _wrap_text(text, font, right - x - indent)
+        return [(bullet + lines[0], x)] + [(line, x + indent) for line in lines[1:]]
+    
+    def _draw_static_text(self, name: str, origin: Tuple[int, int],
+                          build_items: Callable[[], Tuple[Tuple[Any, ...], ...]]):
+        """Draw fixed-color glowing labels from a layer composited once per glow quality"""
+        cached = self._static_layers.get(name)
+        if cached is None or cached[0] != self.quality_scale:
+            items = self._static_plans.get(name)
+            if items is None:
+                items = self._static_plans[name] = build_items()
+            cached = self._static_layers[name] = (self.quality_scale, *self._build_static_layer(items))
+        _, layer, (offset_x, offset_y) = cached
+        if layer is not None:
+            self.screen.blit(layer, (origin[0] + offset_x, origin[1] + offset_y),
+                             special_flags=pygame.BLEND_PREMULTIPLIED)
+    
+    def _build_static_layer(self, items: Tuple[Tuple[Any, ...], ...]) -> Tuple[Optional[pygame.Surface], Tuple[int, int]]:
+        """Premultiplied layer with every label and its tinted halo, plus its offset from the panel origin"""
+        stamps = []
+        for text, font, (x, y), color, glow_size in items:
+            glow_size = int(glow_size * self.quality_scale)
+            text_surface, halo = self._get_glow_halo(text, font, glow_size)
+            glow_box = pygame.Rect(x - glow_size, y - glow_size,
+                                   text_surface.get_width() + glow_size * 2,
+                                   text_surface.get_height() + glow_size * 2)
+            stamps.append((text_surface, halo, (x, y), glow_box, color))
+        if not stamps:
+            return None, (0, 0)
+        
+        bounds = stamps[0][3].unionall([glow_box for _, _, _, glow_box, _ in stamps[1:]])
+        layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        
+        # Premultiplied "over" is associative, so labels composited here and the layer
+        # composited onto the screen match drawing each label straight onto the screen
+        layer_stamps = []
+        for text_surface, halo, (x, y), glow_box, color in stamps:
+            if halo is not None:
+                glow_surface = halo.copy()
+                glow_surface.fill(color, special_flags=pygame.BLEND_RGB_MULT)
+                layer_stamps.append((glow_surface, (glow_box.x - bounds.x, glow_box.y - bounds.y)))
+            layer_stamps.append((text_surface.premul_alpha(), (x - bounds.x, y - bounds.y)))
+        _blit_all(layer, layer_stamps, pygame.BLEND_PREMULTIPLIED)
+        
+        return _convert_for_display(layer), bounds.topleft
     
     def draw_animated_background(self, rect: pygame.Rect):
         """Draw animated pixel-style background with flowing effects"""
+        current_time = self._frame_t
+        grid_size = 20
+        
+        if np is not None and rect.width > 0 and rect.height > 0:
+            self.screen.blit(self._render_background(rect, current_time, grid_size), rect.topleft)
+            return
+        
         # Base dark background
         pygame.draw.rect(self.screen, (20, 20, 30), rect)
         
-        current_time = time.time() - self.start_time
-        
         # Draw flowing pixel grid
-        grid_size = 20
-        for x in range(rect.x, rect.x + rect.width, grid_size):
-            for y in range(rect.y, rect.y + rect.height, grid_size):
-                # Create wave pattern
-                wave_offset = math.sin((x + y) * 0.02 + current_time * 2) * 0.5 + 0.5
-                
-                # Different colors based on position and time
-                hue = ((x + y) * 0.01 + current_time * 0.5) % 6.0
-                if hue < 2:
-                    base_color = (int(50 + wave_offset * 30), int(20 + wave_offset * 15), int(80 + wave_offset * 40))
-                elif hue < 4:
-                    base_color = (int(20 + wave_offset * 15), int(50 + wave_offset * 30), int(80 + wave_offset * 40))
-                else:
-                    base_color = (int(80 + wave_offset * 40), int(20 + wave_offset * 15), int(50 + wave_offset * 30))
-                
-                # Draw small pixels
-                if wave_offset > 0.7:  # Only draw bright pixels
-                    pixel_rect = pygame.Rect(x, y, 2, 2)
-                    pygame.draw.rect(self.screen, base_color, pixel_rect)
+        xs = range(rect.x, rect.x + rect.width, grid_size)
+        ys = range(rect.y, rect.y + rect.height, grid_size)
+        columns, rows = len(xs), len(ys)
+        fill = self.screen.fill
+        
+        # The pattern only depends on x + y, so work out each grid diagonal once
+        # and only visit the cells of the bright ones
+        for k in range(columns + rows - 1):
+            diagonal = xs.start + ys.start + k * grid_size
+            
+            # Create wave pattern
+            wave_offset = math.sin(diagonal * 0.02 + current_time * 2) * 0.5 + 0.5
+            if wave_offset <= 0.7:  # Only draw bright pixels
+                continue
+            
+            # Different colors based on position and time
+            hue = (diagonal * 0.01 + current_time * 0.5) % 6.0
+            if hue < 2:
+                base_color = (int(50 + wave_offset * 30), int(20 + wave_offset * 15), int(80 + wave_offset * 40))
+            elif hue < 4:
+                base_color = (int(20 + wave_offset * 15), int(50 + wave_offset * 30), int(80 + wave_offset * 40))
+            else:
+                base_color = (int(80 + wave_offset * 40), int(20 + wave_offset * 15), int(50 + wave_offset * 30))
+            
+            # Draw small pixels
+            for column in range(max(0, k - rows + 1), min(k, columns - 1) + 1):
+                fill(base_color, (xs[column], ys[k - column], 2, 2))
+    
+    def _render_background(self, rect: pygame.Rect, current_time: float, grid_size: int) -> pygame.Surface:
+        """Animated background for rect, written into a reused surface through a pixel array"""
+        cached = self._bg_surfaces.get(rect.size)
+        if cached is None:
+            surface = _convert_for_display(pygame.Surface(rect.size), per_pixel_alpha=False)
+            surface.fill((20, 20, 30))
+            columns = -(-rect.width // grid_size)
+            rows = -(-rect.height // grid_size)
+            # Diagonal number (column + row) of every grid cell
+            cell_diagonals = np.add.outer(np.arange(columns), np.arange(rows))
+            cached = self._bg_surfaces[rect.size] = (surface, cell_diagonals)
+        surface, cell_diagonals = cached
+        
+        pixels = pygame.surfarray.pixels3d(surface)
+        _draw_background_dots(pixels, cell_diagonals, rect.x + rect.y, grid_size, current_time)
+        del pixels
+        return surface
     
-    def draw_version_overlay(self) -> Optional[pygame.Rect]:
-        """Draw the enhanced version information overlay"""
+    def draw_version_overlay(self, mouse_pos: Optional[Tuple[int, int]] = None) -> Optional[pygame.Rect]:
+        """Draw the enhanced version information overlay - mouse_pos defaults to the current cursor position"""
+        self.begin_frame()
+        screen_size = self.screen.get_size()
+        
         # Create semi-transparent background with starfield effect
-        overlay_surface = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay_surface.set_alpha(170)
-        overlay_surface.fill((0, 0, 0))
-        self.screen.blit(overlay_surface, (0, 0))
-        
-        # Add twinkling stars
-        current_time = time.time() - self.start_time
-        for i in range(50):
-            star_x = (i * 137) % self.screen.get_width()  # Pseudo-random positions
-            star_y = (i * 211) % self.screen.get_height()
-            twinkle = math.sin(current_time * 2 + i) * 0.5 + 0.5
-            if twinkle > 0.6:
-                star_color = self.get_rgb_color(1.0, twinkle)
-                pygame.draw.circle(self.screen, star_color, (star_x, star_y), 1)
+        self.screen.blit(_get_dim_surface(screen_size, 170), (0, 0))
+        
+        # Add twinkling stars (pseudo-random fixed positions, one shared hue)
+        r, g, b = self.get_rgb_color(1.0)
+        for star_x, star_y, twinkle in _twinkling_stars(50, *screen_size, self._frame_t):
+            star_color = (int(r * twinkle), int(g * twinkle), int(b * twinkle))
+            pygame.draw.circle(self.screen, star_color, (star_x, star_y), 1)
         
         # Calculate content area
-        content_width = 850
-        content_height = 650
-        content_x = (self.screen.get_width() - content_width) // 2
-        content_y = (self.screen.get_height() - content_height) // 2
+        content_rect = self._panel_rect("version", screen_size)
+        content_x, content_y, content_width, content_height = content_rect
         
         # Draw animated background
-        content_rect = pygame.Rect(content_x, content_y, content_width, content_height)
         self.draw_animated_background(content_rect)
         
         # Draw glowing border
         self.draw_glowing_rect(content_rect, 12)
         
         # Draw close button with glow
-        close_button_size = 30
-        close_x = content_x + content_width - close_button_size - 10
-        close_y = content_y + 10
-        close_rect = pygame.Rect(close_x, close_y, close_button_size, close_button_size)
-        
-        mouse_pos = pygame.mouse.get_pos()
-        close_hover = close_rect.collidepoint(mouse_pos)
-        
-        if close_hover:
-            self.draw_glowing_rect(close_rect, 6, (255, 100, 100))
-        
-        pygame.draw.rect(self.screen, self.button_hover_color if close_hover else self.button_color, close_rect)
-        pygame.draw.rect(self.screen, self.text_color, close_rect, 2)
-        
-        # Draw X in close button
-        x_size = 8
-        x_center = close_rect.center
-        pygame.draw.line(self.screen, self.text_color, 
-                        (x_center[0] - x_size, x_center[1] - x_size),
-                        (x_center[0] + x_size, x_center[1] + x_size), 2)
-        pygame.draw.line(self.screen, self.text_color,
-                        (x_center[0] + x_size, x_center[1] - x_size),
-                        (x_center[0] - x_size, x_center[1] + x_size), 2)
+        close_rect = self._close_rect_in(content_rect)
+        self._draw_close_button(close_rect, mouse_pos, 6, (255, 100, 100))
         
         # Draw version content with glowing effects
-        current_y = content_y + 20
+        title = self.version_info["title"]
+        title_x = content_x + (content_width - self._text_size(self.font_large, title)[0]) // 2
         
         # Title with rainbow glow
-        title_surface = self.draw_glowing_text(
-            self.version_info["title"], 
-            self.font_large, 
-            (content_x + (content_width - self.font_large.size(self.version_info["title"])[0]) // 2, current_y),
-            glow_size=5
-        )
-        current_y += title_surface.get_height() + 10
-        
-        # Version with cyan glow
-        version_pos = (content_x + (content_width - self.font_small.size(self.version_info["version"])[0]) // 2, current_y)
-        self.draw_glowing_text(self.version_info["version"], self.font_small, version_pos, (0, 160, 160), 3)
-        current_y += self.font_small.get_height() + 20
-        
-        # System info with subtle glow
-        info_items = [
-            f"Build Date: {self.version_info['build_date']}",
-            f"Engine: {self.version_info['engine']}",
-            f"Python: {self.version_info['python_version']}"
-        ]
-        
-        for item in info_items:
-            self.draw_glowing_text(item, self.font_chat, (content_x + 40, current_y), (60, 120, 160), 2)
-            current_y += self.font_chat.get_height() + 8
+        self.draw_glowing_text(title, self.font_large, (title_x, content_y + 20), glow_size=5)
         
-        current_y += 20
-        
-        # Features section with alternating colors
-        features_title_pos = (content_x + 40, current_y)
-        self.draw_glowing_text("KEY FEATURES:", self.font_small, features_title_pos, (220, 220, 0), 3)
-        current_y += self.font_small.get_height() + 10
-        
-        for i, feature in enumerate(self.version_info["features"]):
-            # Alternate between different glow colors
-            colors = [(180, 80, 180), (80, 180, 80), (180, 110, 80), (80, 180, 180)]
-            color = colors[i % len(colors)]
-            
-            feature_text = f"• {feature}"
-            self.draw_glowing_text(feature_text, self.font_chat, (content_x + 60, current_y), color, 2)
-            current_y += self.font_chat.get_height() + 6
+        # Version, system info and features keep fixed colors, so they come from one cached layer
+        self._draw_static_text("version", (content_x, content_y), self._version_static_items)
         
         # Instructions with pulsing glow
         current_y = content_y + content_height - 40
         instruction_text = "Press ESC or click X to close"
-        instruction_x = content_x + (content_width - self.font_chat.size(instruction_text)[0]) // 2
+        instruction_x = content_x + (content_width - self._text_size(self.font_chat, instruction_text)[0]) // 2
         pulse_color = tuple(int(150 * self.get_pulse_intensity(1.5, 0.5)) for _ in range(3))
         self.draw_glowing_text(instruction_text, self.font_chat, (instruction_x, current_y), pulse_color, 2)
         
         return close_rect
     
-    def draw_credits_overlay(self) -> Optional[pygame.Rect]:
-        """Draw the enhanced credits overlay"""
+    def draw_credits_overlay(self, mouse_pos: Optional[Tuple[int, int]] = None) -> Optional[pygame.Rect]:
+        """Draw the enhanced credits overlay - mouse_pos defaults to the current cursor position"""
+        self.begin_frame()
+        screen_size = self.screen.get_size()
+        
         # Create semi-transparent background
-        overlay_surface = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay_surface.set_alpha(200)
-        overlay_surface.fill((0, 0, 0))
-        self.screen.blit(overlay_surface, (0, 0))
+        self.screen.blit(_get_dim_surface(screen_size, 200), (0, 0))
         
         # Add matrix-style falling pixels
-        current_time = time.time() - self.start_time
-        for i in range(30):
-            x = (i * 73) % self.screen.get_width()
-            y = int((current_time * 50 + i * 100) % (self.screen.get_height() + 200))
-            alpha = max(0, 255 - (y % 200))
-            color = self.get_rgb_color(0.5, alpha / 255.0)
-            if alpha > 50:
-                pygame.draw.rect(self.screen, color, (x, y, 2, 8))
+        r, g, b = self.get_rgb_color(0.5)
+        for x, y, alpha in _falling_pixels(30, 73, 100, 50, 200, 255, 50, *screen_size, self._frame_t):
+            brightness = alpha / 255.0
+            self.screen.fill((int(r * brightness), int(g * brightness), int(b * brightness)), (x, y, 2, 8))
         
         # Calculate content area (wider for credits)
-        content_width = 700
-        content_height = 600
-        content_x = (self.screen.get_width() - content_width) // 2
-        content_y = (self.screen.get_height() - content_height) // 2
+        content_rect = self._panel_rect("credits", screen_size)
+        content_x, content_y, content_width, content_height = content_rect
         
         # Draw animated background
-        content_rect = pygame.Rect(content_x, content_y, content_width, content_height)
         self.draw_animated_background(content_rect)
         
         # Draw glowing border
         self.draw_glowing_rect(content_rect, 15)
         
         # Draw close button
-        close_button_size = 30
-        close_x = content_x + content_width - close_button_size - 10
-        close_y = content_y + 10
-        close_rect = pygame.Rect(close_x, close_y, close_button_size, close_button_size)
-        
-        mouse_pos = pygame.mouse.get_pos()
-        close_hover = close_rect.collidepoint(mouse_pos)
-        
-        if close_hover:
-            self.draw_glowing_rect(close_rect, 6, (255, 100, 100))
-        
-        pygame.draw.rect(self.screen, self.button_hover_color if close_hover else self.button_color, close_rect)
-        pygame.draw.rect(self.screen, self.text_color, close_rect, 2)
-        
-        # Draw X in close button
-        x_size = 8
-        x_center = close_rect.center
-        pygame.draw.line(self.screen, self.text_color, 
-                        (x_center[0] - x_size, x_center[1] - x_size),
-                        (x_center[0] + x_size, x_center[1] + x_size), 2)
-        pygame.draw.line(self.screen, self.text_color,
-                        (x_center[0] + x_size, x_center[1] - x_size),
-                        (x_center[0] - x_size, x_center[1] + x_size), 2)
+        close_rect = self._close_rect_in(content_rect)
+        self._draw_close_button(close_rect, mouse_pos, 6, (255, 100, 100))
         
         # Draw credits content
-        current_y = content_y + 20
+        title = self.credits_info["title"]
         
         # Title with spectacular glow
-        title_pos = (content_x + (content_width - self.font_large.size(self.credits_info["title"])[0]) // 2, current_y)
-        self.draw_glowing_text(self.credits_info["title"], self.font_large, title_pos, glow_size=6)
-        current_y += self.font_large.get_height() + 20
+        title_pos = (content_x + (content_width - self._text_size(self.font_large, title)[0]) // 2, content_y + 20)
+        self.draw_glowing_text(title, self.font_large, title_pos, glow_size=6)
         
-        # Credits sections with themed colors
-        section_colors = [(255, 100, 100), (100, 255, 100), (100, 100, 255)]
-        
-        for section_idx, section in enumerate(self.credits_info["sections"]):
-            section_color = section_colors[section_idx % len(section_colors)]
-            
-            # Section category with glow
-            category_pos = (content_x + 40, current_y)
-            self.draw_glowing_text(section["category"], self.font_small, category_pos, section_color, 4)
-            current_y += self.font_small.get_height() + 8
-            
-            # Section entries with subtle glow
-            for entry in section["entries"]:
-                entry_text = f"• {entry}"
-                entry_color = tuple(int(c * 0.7) for c in section_color)  # Dimmer version
-                self.draw_glowing_text(entry_text, self.font_chat, (content_x + 60, current_y), entry_color, 2)
-                current_y += self.font_chat.get_height() + 4
-            
-            current_y += 15  # Space between sections
+        # Credits sections keep fixed colors, so they come from one cached layer
+        self._draw_static_text("credits", (content_x, content_y), self._credits_static_items)
         
         # Instructions
         instruction_y = content_y + content_height - 35
         instruction_text = "Click the screen, the X or ESC to close"  # Removed X reference
-        instruction_x = content_x + (content_width - self.font_chat.size(instruction_text)[0]) // 2
+        instruction_x = content_x + (content_width - self._text_size(self.font_chat, instruction_text)[0]) // 2
         pulse_color = tuple(int(150 * self.get_pulse_intensity(1.5, 0.5)) for _ in range(3))
         self.draw_glowing_text(instruction_text, self.font_chat, (instruction_x, instruction_y), pulse_color, 2)
         
@@ -583,45 +1049,63 @@ class OverlaySystem:
     
     def draw_corner_version(self):
         """Draw version number in corner with glowing effect"""
+        self.begin_frame()
+        
         version_text = self.version_info["version"]
         padding = 12
         
         # Position in bottom-right corner
-        text_size = self.font_chat.size(version_text)
+        text_size = self._text_size(self.font_chat, version_text)
         bg_width = text_size[0] + padding * 2
         bg_height = text_size[1] + padding * 2
-        bg_x = self.screen.get_width() - bg_width - 15
-        bg_y = self.screen.get_height() - bg_height - 15
+        screen_width, screen_height = self.screen.get_size()
+        bg_x = screen_width - bg_width - 15
+        bg_y = screen_height - bg_height - 15
         
         # Draw glowing background
         bg_rect = pygame.Rect(bg_x, bg_y, bg_width, bg_height)
         self.draw_glowing_rect(bg_rect, 5, (0, 180, 180))
         
-        # Draw semi-transparent background
-        bg_surface = pygame.Surface((bg_width, bg_height))
-        bg_surface.set_alpha(150)
-        bg_surface.fill((0, 0, 0))
-        self.screen.blit(bg_surface, (bg_x, bg_y))
-        
-        # Draw glowing text
-        text_x = bg_x + padding
-        text_y = bg_y + padding
-        self.draw_glowing_text(version_text, self.font_chat, (text_x, text_y), (0, 180, 180), 2)
+        # Semi-transparent background and glowing text never change, so they are one cached layer
+        self.screen.blit(self._get_corner_layer(version_text, (bg_width, bg_height), padding), (bg_x, bg_y),
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
+    
+    def _get_corner_layer(self, version_text: str, size: Tuple[int, int], padding: int) -> pygame.Surface:
+        """Premultiplied corner badge - the dim backdrop with the glowing version text over it"""
+        key = (version_text, size, padding, self.quality_scale)
+        if self._corner_layer is None or self._corner_layer[0] != key:
+            layer = pygame.Surface(size, pygame.SRCALPHA)
+            layer.fill((0, 0, 0, 150))  # Black is the same premultiplied or not
+            text_layer, offset = self._build_static_layer(
+                ((version_text, self.font_chat, (padding, padding), (0, 180, 180), 2),))
+            layer.blit(text_layer, offset, special_flags=pygame.BLEND_PREMULTIPLIED)
+            self._corner_layer = (key, _convert_for_display(layer))
+        return self._corner_layer[1]
+    
+    def _panel_rect(self, overlay_type: str, screen_size: Optional[Tuple[int, int]] = None) -> pygame.Rect:
+        """Content panel of an overlay, centered on the screen (screen_size defaults to the current one)"""
+        screen_width, screen_height = screen_size or self.screen.get_size()
+        content_width, content_height = self.PANEL_SIZES[overlay_type]
+        content_x = (screen_width - content_width) // 2
+        content_y = (screen_height - content_height) // 2
+        return pygame.Rect(content_x, content_y, content_width, content_height)
+    
+    def _close_rect_in(self, panel: pygame.Rect) -> pygame.Rect:
+        """Close button in the top-right corner of a panel"""
+        size = self.CLOSE_BUTTON_SIZE
+        return pygame.Rect(panel.right - size - 10, panel.y + 10, size, size)
+    
+    def _close_rect_for(self, overlay_type: str) -> pygame.Rect:
+        """Close button in the top-right corner of an overlay's panel"""
+        return self._close_rect_in(self._panel_rect(overlay_type))
     
     def handle_overlay_click(self, pos: Tuple[int, int], overlay_type: str) -> bool:
         """Handle clicks on overlay elements"""
-        if overlay_type == "version":
-            close_rect = self.draw_version_overlay()
-        elif overlay_type == "credits":
-            close_rect = self.draw_credits_overlay()
-        else:
+        if overlay_type not in self.PANEL_SIZES:
             return False
         
-        # Check if close button was clicked
-        if close_rect and close_rect.collidepoint(pos):
-            return True
-        
-        return False
+        # Check if close button was clicked - pure geometry, nothing is redrawn
+        return self._close_rect_for(overlay_type).collidepoint(pos)
     
 
     def draw_keybind_overlay(self, keybind_manager, scroll_offset: int = 0,
@@ -629,6 +1113,8 @@ class OverlaySystem:
         """Draw the enhanced keybind configuration overlay with scrolling and UI improvements"""
         from config.settings import KEYBIND_CATEGORIES, KEYBIND_DISPLAY_NAMES, KEYBIND_MENU_SETTINGS
 
+        self.begin_frame()
+
         button_height = 40
         button_spacing = 20
         panel_padding = 20
@@ -644,25 +1130,19 @@ class OverlaySystem:
         }
 
         # Create overlay background
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay.set_alpha(160)
-        overlay.fill((10, 10, 20, 160))
-        self.screen.blit(overlay, (0, 0))
-
-        # Matrix-style falling pixels (dimmed)
-        now = time.time() - self.start_time
-        for i in range(40):
-            x = (i * 67) % self.screen.get_width()
-            y = int((now * 60 + i * 120) % (self.screen.get_height() + 300))
-            alpha = max(0, 180 - (y % 300))  # Reduced from 255 to 180
-            col = self.get_rgb_color(0.3, alpha / 300.0)  # Dimmed further
-            if alpha > 30:
-                pygame.draw.rect(self.screen, col, (x, y, 4, 6))
+        screen_width, screen_height = self.screen.get_size()
+        self.screen.blit(_get_dim_surface((screen_width, screen_height), 160, (10, 10, 20)), (0, 0))
+
+        # Matrix-style falling pixels (dimmed - peak alpha reduced from 255 to 180)
+        r, g, b = self.get_rgb_color(0.3)
+        for x, y, alpha in _falling_pixels(40, 67, 120, 60, 300, 180, 30, screen_width, screen_height, self._frame_t):
+            brightness = alpha / 300.0  # Dimmed further
+            self.screen.fill((int(r * brightness), int(g * brightness), int(b * brightness)), (x, y, 4, 6))
 
         # Main panel dimensions and positioning
         w, h = 800, 670
-        px = (self.screen.get_width() - w) // 2
-        py = (self.screen.get_height() - h) // 2
+        px = (screen_width - w) // 2
+        py = (screen_height - h) // 2
         panel = pygame.Rect(px, py, w, h)
         
         # Store panel rect for click detection
@@ -679,13 +1159,13 @@ class OverlaySystem:
 
         # Title with dimmed glow
         title = "KEYBIND SETTINGS"
-        tx = px + (w - self.font_large.size(title)[0]) // 2
+        tx = px + (w - self._text_size(self.font_large, title)[0]) // 2
         self.draw_glowing_text(title, self.font_large, (tx, y0), self.get_rgb_color(1.0, 0.7), glow_size=2)  # Dimmed brightness
         y0 += self.font_large.get_height() + 20  # Add space after title
 
         # Conflict message with dimmed glow
         if conflict_message:
-            cx = px + (w - self.font_small.size(conflict_message)[0]) // 2
+            cx = px + (w - self._text_size(self.font_small, conflict_message)[0]) // 2
             self.draw_glowing_text(conflict_message, self.font_small, (cx, y0), (200, 80, 80), 2)  # Dimmed red
             y0 += self.font_small.get_height() + 15
 
@@ -730,8 +1210,7 @@ class OverlaySystem:
             sbx = px + w - content_padding - sbw - scrollbar_margin
             bar = pygame.Rect(sbx, start_y, sbw, area_h)
             interactive_elements["scrollbar"] = bar
-            pygame.draw.rect(self.screen, (60, 60, 60), bar, border_radius=10)
-            pygame.draw.rect(self.screen, self.text_color, bar, 2, border_radius=10)
+            self.screen.blit(_get_scrollbar_track(bar.size, self.text_color), bar)
 
             # Use the same max_scroll for ratio calculation
             ratio = min(1.0, self.current_scroll_offset / max_scroll) if max_scroll > 0 else 0
@@ -766,11 +1245,7 @@ class OverlaySystem:
         scrollbar_space = scrollbar_width + scrollbar_margin * 2 if total_h > area_h else 0
         content = pygame.Rect(px + content_padding, start_y, 
                              w - (content_padding * 2) - scrollbar_space, area_h)
-        bg = pygame.Surface((content.width, content.height), pygame.SRCALPHA)
-        bg.fill((20, 20, 30, 200))
-        pygame.draw.rect(bg, (255, 255, 255, 30), bg.get_rect(), border_radius=10)  # Dimmed border
-        self.screen.blit(bg, content.topleft)
-        pygame.draw.rect(self.screen, (120, 120, 160), content, 2, border_radius=10)  # Dimmed border
+        self.screen.blit(_get_backdrop_surface(content.size), content.topleft)
         
         # Content clipping with internal padding - ensure text doesn't get cut off
         clip_rect = pygame.Rect(content.x + internal_padding, content.y + internal_padding, 
@@ -790,7 +1265,7 @@ class OverlaySystem:
             
             # Text rendering with enhanced effects
             edge_padding = 10
-            ts = self.font_chat.render(text, True, (255, 255, 255))
+            ts = self._render(self.font_chat, text, (255, 255, 255))
             
             # Enhanced text scrolling for long text
             if ts.get_width() > rect.width - (edge_padding * 2):
@@ -833,7 +1308,9 @@ class OverlaySystem:
         close_hover = cr.collidepoint(pygame.mouse.get_pos())
         draw_button(cr, (200, 80, 80), close_hover, 'X')  # Dimmed red
 
-        # Draw keybind categories and items with proper spacing
+        # Draw keybind categories and items with proper spacing - plain item names are
+        # collected and blitted in one batch after the list
+        name_stamps = []
         dy = start_y - self.current_scroll_offset + internal_padding
         for cat, acts in KEYBIND_CATEGORIES.items():
             if dy > start_y + area_h + 5:
@@ -886,8 +1363,7 @@ class OverlaySystem:
                     ])
                     pygame.draw.circle(self.screen, (0, 0, 0), (warning_x + 4, warning_y + 5), 1)
                 else:
-                    color = (255, 255, 255)
-                    self.draw_glowing_text(nm, self.font_chat, pos, color, 0)
+                    name_stamps.append((self._render(self.font_chat, nm, (255, 255, 255)), pos))
 
                 # Keybind button with proper spacing from content edge
                 button_margin = 20  # Space from right edge of content area
@@ -900,29 +1376,22 @@ class OverlaySystem:
                 dy += KEYBIND_MENU_SETTINGS['item_height']
             dy += 15  # Section spacing
 
+        _blit_all(self.screen, name_stamps)
         self.screen.set_clip(None)
 
         # Draw shadows to indicate scrollable content
         if total_h > area_h:
             shadow_height = 20  # Increased shadow height
-            shadow_color_base = (0, 0, 0)
             
-            # Top shadow if scrolled down
+            # Top shadow if scrolled down (stronger fade from 120 to 0)
             if self.current_scroll_offset > 5:
-                for i in range(shadow_height):
-                    alpha = int(120 * (1 - i / shadow_height))  # Stronger fade from 120 to 0
-                    shadow_surface = pygame.Surface((content.width, 1), pygame.SRCALPHA)
-                    shadow_surface.fill((*shadow_color_base, alpha))
-                    self.screen.blit(shadow_surface, (content.x, content.y + i))
+                self.screen.blit(_get_shadow_surface(content.width, shadow_height, False), content.topleft)
             
             # Bottom shadow if not at bottom - only show if there's actual content to scroll to
             content_only_height = total_h - extra_bottom_margin
             if self.current_scroll_offset < (content_only_height - area_h) - 5:
-                for i in range(shadow_height):
-                    alpha = int(120 * (i / shadow_height))  # Stronger fade from 0 to 120
-                    shadow_surface = pygame.Surface((content.width, 1), pygame.SRCALPHA)
-                    shadow_surface.fill((*shadow_color_base, alpha))
-                    self.screen.blit(shadow_surface, (content.x, content.y + content.height - shadow_height + i))
+                self.screen.blit(_get_shadow_surface(content.width, shadow_height, True),
+                                 (content.x, content.y + content.height - shadow_height))
 
         # Bottom buttons with proper padding
         by = py + h - panel_padding - bh - decorative_inset + 5
@@ -987,7 +1456,7 @@ class OverlaySystem:
         
         # Lock icon/button
         lock_size = 25
-        lock_x = toggle_x + toggle_width + 20 + font.size(label_text)[0] + 15
+        lock_x = toggle_x + toggle_width + 20 + self._text_size(font, label_text)[0] + 15
         lock_rect = pygame.Rect(lock_x, y_position + 2, lock_size, lock_size)
         
         # Draw lock icon with glow if locked
@@ -1026,84 +1495,54 @@ def trigger_save_feedback(self):
     self._save_feedback_time = time.time()
 
 
-class ModalOverlay:
+class ModalOverlay(_OverlayEffects):
     """Enhanced generic modal overlay with glowing effects"""
     
     def __init__(self, screen: pygame.Surface, title: str, content: List[str], 
                  font_large: pygame.font.Font, font_small: pygame.font.Font):
         """Initialize a generic modal overlay with effects"""
-        self.screen = screen
+        super().__init__(screen)
         self.title = title
         self.content = content
         self.font_large = font_large
         self.font_small = font_small
         
-        # Animation timing
-        self.start_time = time.time()
-        
         self.bg_color = (0, 0, 0, 180)
         self.text_color = (170, 170, 170)
         self.button_color = (60, 60, 60)
         self.button_hover_color = (80, 80, 80)
+        
+        # Body lines rendered into one surface on first draw, rebuilt only if the content changes
+        self._body_lines: Optional[Tuple[str, ...]] = None
+        self._body_surface: Optional[pygame.Surface] = None
     
     def get_rgb_color(self, speed: float = 1.0) -> Tuple[int, int, int]:
         """Generate cycling RGB color with darker tones"""
-        current_time = time.time() - self.start_time
-        hue = (current_time * speed) % 0.6
-
-        scale = 0.6  # Scale factor to darken all colors (0.0 = black, 1.0 = full brightness)
-
-        if hue < 1:
-            r, g, b = 255, int(255 * hue), 0
-        elif hue < 2:
-            r, g, b = int(255 * (2 - hue)), 180, 0
-        elif hue < 3:
-            r, g, b = 0, 180, int(255 * (hue - 2))
-        elif hue < 4:
-            r, g, b = 0, int(255 * (4 - hue)), 255
-        elif hue < 5:
-            r, g, b = int(255 * (hue - 4)), 0, 255
-        else:
-            r, g, b = 255, 0, int(255 * (6 - hue))
+        hue = (self._frame_t * speed) % 0.6
 
-        # Apply brightness scaling
-        r = int(r * scale)
-        g = int(g * scale)
-        b = int(b * scale)
-
-        return (r, g, b)
+        # Darkened (x0.6) colors, pre-scaled in the table
+        return _DARK_RGB_LUT[int(hue * 255) % len(_DARK_RGB_LUT)]
 
     
     def draw_glowing_rect(self, rect: pygame.Rect, glow_size: int = 6):
         """Draw rectangle with glow effect"""
-        color = self.get_rgb_color(1.5)
-        pulse = (math.sin((time.time() - self.start_time) * 3) + 1) / 2 * 0.6 + 0.4
-        
-        for i in range(glow_size, 0, -1):
-            alpha = int(40 * pulse * (glow_size - i + 1) / glow_size)
-            glow_color = (*color, alpha)
-            
-            glow_surface = pygame.Surface((rect.width + i * 2, rect.height + i * 2), pygame.SRCALPHA)
-            glow_rect = pygame.Rect(0, 0, rect.width + i * 2, rect.height + i * 2)
-            pygame.draw.rect(glow_surface, glow_color, glow_rect, max(1, i // 2))
-            
-            self.screen.blit(glow_surface, (rect.x - i, rect.y - i), special_flags=pygame.BLEND_ALPHA_SDL2)
+        self._draw_glow_outline(rect, glow_size, self.get_rgb_color(1.5), self.get_pulse_intensity(3.0, 0.4), 40)
     
-    def draw(self) -> Optional[pygame.Rect]:
-        """Draw the enhanced modal overlay"""
+    def draw(self, mouse_pos: Optional[Tuple[int, int]] = None) -> Optional[pygame.Rect]:
+        """Draw the enhanced modal overlay - mouse_pos defaults to the current cursor position"""
+        self.begin_frame()
+        screen_width, screen_height = self.screen.get_size()
+        
         # Semi-transparent background
-        overlay_surface = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay_surface.set_alpha(200)
-        overlay_surface.fill((0, 0, 0))
-        self.screen.blit(overlay_surface, (0, 0))
+        self.screen.blit(_get_dim_surface((screen_width, screen_height), 200), (0, 0))
         
         # Calculate content dimensions
         max_width = 600
         line_height = self.font_small.get_height() + 5
         content_height = len(self.content) * line_height + 120
         
-        content_x = (self.screen.get_width() - max_width) // 2
-        content_y = (self.screen.get_height() - content_height) // 2
+        content_x = (screen_width - max_width) // 2
+        content_y = (screen_height - content_height) // 2
         
         # Draw content background with glow
         content_rect = pygame.Rect(content_x, content_y, max_width, content_height)
@@ -1116,35 +1555,17 @@ class ModalOverlay:
         close_x = content_x + max_width - close_button_size - 10
         close_y = content_y + 10
         close_rect = pygame.Rect(close_x, close_y, close_button_size, close_button_size)
-        
-        mouse_pos = pygame.mouse.get_pos()
-        close_hover = close_rect.collidepoint(mouse_pos)
-        
-        if close_hover:
-            self.draw_glowing_rect(close_rect, 4)
-        
-        pygame.draw.rect(self.screen, self.button_hover_color if close_hover else self.button_color, close_rect)
-        pygame.draw.rect(self.screen, self.text_color, close_rect, 2)
-        
-        # Draw X
-        x_size = 8
-        x_center = close_rect.center
-        pygame.draw.line(self.screen, self.text_color, 
-                        (x_center[0] - x_size, x_center[1] - x_size),
-                        (x_center[0] + x_size, x_center[1] + x_size), 2)
-        pygame.draw.line(self.screen, self.text_color,
-                        (x_center[0] + x_size, x_center[1] - x_size),
-                        (x_center[0] - x_size, x_center[1] + x_size), 2)
+        self._draw_close_button(close_rect, mouse_pos, 4)
         
         # Draw title with glow
         current_y = content_y + 20
-        title_surface = self.font_large.render(self.title, True, self.text_color)
+        title_surface = self._render(self.font_large, self.title, self.text_color)
         title_x = content_x + (max_width - title_surface.get_width()) // 2
         
-        # Glow effect for title
+        # Glow effect for title - one render per frame, only the alpha changes per layer
         glow_color = self.get_rgb_color(2.0)
+        glow_surface = self.font_large.render(self.title, True, glow_color)
         for i in range(3, 0, -1):
-            glow_surface = self.font_large.render(self.title, True, glow_color)
             glow_surface.set_alpha(60 // i)
             self.screen.blit(glow_surface, (title_x - i, current_y - i), special_flags=pygame.BLEND_ALPHA_SDL2)
             self.screen.blit(glow_surface, (title_x + i, current_y + i), special_flags=pygame.BLEND_ALPHA_SDL2)
@@ -1153,11 +1574,22 @@ class ModalOverlay:
         current_y += title_surface.get_height() + 20
         
         # Draw content
-        for line in self.content:
-            line_surface = self.font_small.render(line, True, self.text_color)
-            self.screen.blit(line_surface, (content_x + 20, current_y))
-            current_y += line_height
+        self.screen.blit(self._get_body_surface(line_height), (content_x + 20, current_y))
         
         return close_rect
     
+    def _get_body_surface(self, line_height: int) -> pygame.Surface:
+        """All content lines rendered once into a single transparent surface"""
+        lines = tuple(self.content)
+        if self._body_lines != lines:
+            line_surfaces = [self._render(self.font_small, line, self.text_color) for line in lines]
+            width = max((surface.get_width() for surface in line_surfaces), default=0)
+            body = pygame.Surface((width, len(lines) * line_height), pygame.SRCALPHA)
+            # Lines never overlap, so MAX onto the clear surface copies them without re-blending
+            for i, line_surface in enumerate(line_surfaces):
+                body.blit(line_surface, (0, i * line_height), special_flags=pygame.BLEND_RGBA_MAX)
+            self._body_lines = lines
+            self._body_surface = _convert_for_display(body)
+        return self._body_surface
+    
     
\ No newline at end of file
@@ -0,0 +1,208 @@
+"""
+Spatial index for building rectangles - quadtree and uniform grid broad-phases for overlap queries
+"""
+import pygame
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+class _QuadNode:
+    """Single quadtree node - a small leaf list plus an optional array of four children"""
+
+    __slots__ = ("left", "top", "right", "bottom", "depth", "items", "children")
+
+    def __init__(self, left: int, top: int, right: int, bottom: int, depth: int):
+        self.left = left
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+        self.depth = depth
+        # Items are (left, top, right, bottom, payload) so tests are plain int compares
+        self.items: List[Tuple[int, int, int, int, Any]] = []
+        self.children = None
+
+    def split(self):
+        """Create the four child quadrants"""
+        mid_x = (self.left + self.right) // 2
+        mid_y = (self.top + self.bottom) // 2
+        depth = self.depth + 1
+        self.children = [
+            _QuadNode(self.left, self.top, mid_x, mid_y, depth),
+            _QuadNode(mid_x, self.top, self.right, mid_y, depth),
+            _QuadNode(self.left, mid_y, mid_x, self.bottom, depth),
+            _QuadNode(mid_x, mid_y, self.right, self.bottom, depth),
+        ]
+
+    def child_for(self, left: int, top: int, right: int, bottom: int):
+        """Child quadrant fully containing the box, or None if it straddles a split line"""
+        for child in self.children:
+            if (child.left <= left and right <= child.right and
+                    child.top <= top and bottom <= child.bottom):
+                return child
+        return None
+
+
+class QuadTree:
+    """
+    Region quadtree storing (rect, payload) pairs.
+
+    Items that straddle a quadrant boundary stay in the parent node, so every
+    item lives in exactly one node and queries never return duplicates. Rect
+    edges are cached as ints on insert, so queries never call into pygame.
+    """
+
+    def __init__(self, bounds: pygame.Rect, capacity: int = 4, max_depth: int = 6):
+        self.capacity = capacity
+        self.max_depth = max_depth
+        bounds = pygame.Rect(bounds)
+        self._root = _QuadNode(bounds.left, bounds.top, bounds.right, bounds.bottom, 0)
+
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Area covered by the root node"""
+        root = self._root
+        return pygame.Rect(root.left, root.top, root.right - root.left, root.bottom - root.top)
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[pygame.Rect, Any]], capacity: int = 4, max_depth: int = 6) -> "QuadTree":
+        """Build a tree whose root covers the union of all item rects"""
+        items = list(items)
+        if items:
+            bounds = items[0][0].unionall([rect for rect, _ in items[1:]])
+        else:
+            bounds = pygame.Rect(0, 0, 1, 1)
+
+        tree = cls(bounds, capacity, max_depth)
+        for rect, payload in items:
+            tree.insert(rect, payload)
+        return tree
+
+    def insert(self, rect: pygame.Rect, payload: Any):
+        """Insert a rect with an associated payload"""
+        item = (rect.left, rect.top, rect.right, rect.bottom, payload)
+        node = self._root
+        while True:
+            if node.children is not None:
+                child = node.child_for(item[0], item[1], item[2], item[3])
+                if child is not None:
+                    node = child
+                    continue
+                node.items.append(item)
+                return
+
+            node.items.append(item)
+            if len(node.items) > self.capacity and node.depth < self.max_depth:
+                self._split(node)
+            return
+
+    def _split(self, node: _QuadNode):
+        """Split a full leaf and push down every item that fits inside a child"""
+        node.split()
+        remaining = []
+        for item in node.items:
+            child = node.child_for(item[0], item[1], item[2], item[3])
+            if child is not None:
+                child.items.append(item)
+            else:
+                remaining.append(item)
+        node.items = remaining
+
+    def query(self, rect: pygame.Rect) -> List[Any]:
+        """Payloads of every stored rect that overlaps rect"""
+        return self.query_box(rect.left, rect.top, rect.right, rect.bottom)
+
+    def query_box(self, left: int, top: int, right: int, bottom: int) -> List[Any]:
+        """Payloads of every stored rect overlapping the box (same edge rules as colliderect)"""
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for item_left, item_top, item_right, item_bottom, payload in node.items:
+                # AABB reject - exact for positive-size rects, no pygame call per item
+                if (item_left < right and left < item_right and
+                        item_top < bottom and top < item_bottom):
+                    found.append(payload)
+            if node.children is not None:
+                for child in node.children:
+                    if (child.left < right and left < child.right and
+                            child.top < bottom and top < child.bottom):
+                        stack.append(child)
+        return found
+
+
+class SpatialHash:
+    """
+    Uniform grid (spatial hash) storing (rect, payload) pairs.
+
+    Each item is filed under every cell its rect touches - with the cell size
+    at least as large as the biggest item that is one to four cells - so
+    queries are a handful of dict lookups with no tree descent. Best when
+    items are of similar size, such as a hand-placed town layout.
+    """
+
+    def __init__(self, cell_size: int):
+        self.cell_size = max(1, int(cell_size))
+        self._cells: Dict[Tuple[int, int], List[Tuple[int, int, int, int, Any]]] = {}
+        # Occupied cell range, so oversized query boxes never walk empty cells
+        self._cell_bounds = None
+
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Area covered by the occupied cells"""
+        if self._cell_bounds is None:
+            return pygame.Rect(0, 0, 1, 1)
+        min_x, min_y, max_x, max_y = self._cell_bounds
+        cell = self.cell_size
+        return pygame.Rect(min_x * cell, min_y * cell,
+                           (max_x - min_x + 1) * cell, (max_y - min_y + 1) * cell)
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[pygame.Rect, Any]]) -> "SpatialHash":
+        """Build a grid whose cell size matches the largest item rect"""
+        items = list(items)
+        cell_size = max((max(rect.width, rect.height) for rect, _ in items), default=1)
+        grid = cls(cell_size)
+        for rect, payload in items:
+            grid.insert(rect, payload)
+        return grid
+
+    def insert(self, rect: pygame.Rect, payload: Any):
+        """Insert a rect with an associated payload"""
+        item = (rect.left, rect.top, rect.right, rect.bottom, payload)
+        cells = self._cells
+        cell = self.cell_size
+        first_x, last_x = rect.left // cell, (rect.right - 1) // cell
+        first_y, last_y = rect.top // cell, (rect.bottom - 1) // cell
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                cells.setdefault((cell_x, cell_y), []).append(item)
+
+        if self._cell_bounds is None:
+            self._cell_bounds = (first_x, first_y, last_x, last_y)
+        else:
+            min_x, min_y, max_x, max_y = self._cell_bounds
+            self._cell_bounds = (min(min_x, first_x), min(min_y, first_y),
+                                 max(max_x, last_x), max(max_y, last_y))
+
+    def query(self, rect: pygame.Rect) -> List[Any]:
+        """Payloads of every stored rect that overlaps rect"""
+        return self.query_box(rect.left, rect.top, rect.right, rect.bottom)
+
+    def query_box(self, left: int, top: int, right: int, bottom: int) -> List[Any]:
+        """Payloads of every stored rect overlapping the box (same edge rules as colliderect)"""
+        found = []
+        if self._cell_bounds is None:
+            return found
+        seen = set()
+        cells = self._cells
+        cell = self.cell_size
+        min_x, min_y, max_x, max_y = self._cell_bounds
+        for cell_x in range(max(left // cell, min_x), min((right - 1) // cell, max_x) + 1):
+            for cell_y in range(max(top // cell, min_y), min((bottom - 1) // cell, max_y) + 1):
+                for item_left, item_top, item_right, item_bottom, payload in cells.get((cell_x, cell_y), ()):
+                    # Items spanning several cells are seen more than once
+                    if (item_left < right and left < item_right and
+                            item_top < bottom and top < item_bottom and
+                            payload not in seen):
+                        seen.add(payload)
+                        found.append(payload)
+        return found